@@ -7,11 +7,31 @@ import asyncio
 import json
 import logging
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import Any
 
 import websockets
 
+try:  # orjson이 있으면 C 구현으로 직렬화 비용을 줄인다.
+    import orjson
+
+    def json_dumps(payload: Any) -> bytes:
+        return orjson.dumps(payload)
+
+    json_loads = orjson.loads
+except ImportError:  # pragma: no cover - 선택 의존성
+
+    def json_dumps(payload: Any) -> bytes:
+        return json.dumps(payload).encode()
+
+    json_loads = json.loads
+
+
+def json_serialize(obj: Any) -> str:
+    """aiohttp `json=` 직렬화 훅 (str 반환이 필요하다)."""
+    return json_dumps(obj).decode()
+
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -22,14 +42,33 @@ class MasterBridgeError(RuntimeError):
 class MasterBridge(abc.ABC):
     """Codernetes 마스터 서버와 플랫폼을 중계하는 추상 베이스."""
 
+    __slots__ = (
+        "_host",
+        "_port",
+        "_platform",
+        "_master_uri",
+        "_ws",
+        "_stop_event",
+        "_outbox",
+        "_inbound",
+    )
+
+    # 수신 프레임을 병렬로 처리할 워커 수.
+    inbound_workers: int = 4
+
     reconnect_delay: float = 5.0
 
     def __init__(self, host: str, port: int, platform: str) -> None:
         self._host = host
         self._port = port
         self._platform = platform
+        self._master_uri = f"ws://{host}:{port}"
         self._ws: websockets.WebSocketClientProtocol | None = None
         self._stop_event = asyncio.Event()
+        # 송신은 단일 writer 태스크가 전담해 producer가 소켓 쓰기를 기다리지 않는다.
+        self._outbox: asyncio.Queue[str | bytes] = asyncio.Queue(maxsize=1024)
+        # 수신 프레임은 큐에 적재만 하고 워커가 핸들러를 실행해 reader를 막지 않는다.
+        self._inbound: asyncio.Queue[str | bytes] = asyncio.Queue(maxsize=256)
 
     @property
     def platform(self) -> str:
@@ -38,12 +77,32 @@ class MasterBridge(abc.ABC):
     async def start(self) -> None:
         """마스터 서버와 지속적으로 연결을 유지한다."""
         LOGGER.info("[%s] 마스터 브릿지를 시작합니다.", self._platform)
+        workers = [
+            asyncio.create_task(self._inbound_worker(), name=f"bridge-{self._platform}-inbound-{i}")
+            for i in range(self.inbound_workers)
+        ]
+        try:
+            await self._connect_loop()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            for worker in workers:
+                with suppress(asyncio.CancelledError):
+                    await worker
+
+    async def _connect_loop(self) -> None:
         while not self._stop_event.is_set():
             try:
                 async with self._connect_master() as websocket:
                     self._ws = websocket
-                    await self.on_master_connected()
-                    await self._receive_from_master(websocket)
+                    writer = asyncio.create_task(self._drain_outbox(websocket))
+                    try:
+                        await self.on_master_connected()
+                        await self._receive_from_master(websocket)
+                    finally:
+                        writer.cancel()
+                        with suppress(asyncio.CancelledError):
+                            await writer
             except asyncio.CancelledError:  # 프로그램 종료 시그널
                 raise
             except Exception as exc:  # noqa: BLE001
@@ -61,9 +120,15 @@ class MasterBridge(abc.ABC):
 
     @asynccontextmanager
     async def _connect_master(self) -> AsyncIterator[websockets.WebSocketClientProtocol]:
-        uri = f"ws://{self._host}:{self._port}"
-        LOGGER.info("[%s] 마스터 서버(%s)에 연결 시도", self._platform, uri)
-        websocket = await websockets.connect(uri)
+        LOGGER.info("[%s] 마스터 서버(%s)에 연결 시도", self._platform, self._master_uri)
+        # 로컬 마스터 링크는 소형 JSON 프레임 위주라 permessage-deflate가 손해다.
+        websocket = await websockets.connect(
+            self._master_uri,
+            compression=None,
+            max_size=None,
+            ping_interval=20,
+            ping_timeout=20,
+        )
         try:
             yield websocket
         finally:
@@ -74,32 +139,54 @@ class MasterBridge(abc.ABC):
             if not raw:
                 continue
             try:
-                payload = json.loads(raw)
-            except json.JSONDecodeError:
-                LOGGER.debug("[%s] JSON 파싱 실패, 원문 유지: %s", self._platform, raw)
-                await self.on_master_message(raw, None)
-                continue
-
-            msg_type = payload.get("type")
-            if msg_type != "message":
-                LOGGER.debug("[%s] 알 수 없는 메시지 타입: %s", self._platform, payload)
-                continue
+                self._inbound.put_nowait(raw)
+            except asyncio.QueueFull:
+                # 핸들러가 밀리면 최신 프레임을 버리고 reader는 계속 읽는다.
+                LOGGER.warning("[%s] 수신 큐가 가득 차 프레임을 버립니다.", self._platform)
+
+    async def _inbound_worker(self) -> None:
+        while True:
+            raw = await self._inbound.get()
+            try:
+                await self._dispatch_inbound(raw)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.warning("[%s] 수신 메시지 처리 실패: %s", self._platform, exc)
 
-            body = payload.get("payload")
-            bridge_payload: Any
-            if isinstance(body, str):
-                bridge_payload = self._try_parse(body)
-            else:
-                bridge_payload = body
-            await self.on_master_message(payload, bridge_payload)
+    async def _dispatch_inbound(self, raw: str | bytes) -> None:
+        try:
+            payload = json_loads(raw)
+        except ValueError:
+            LOGGER.debug("[%s] JSON 파싱 실패, 원문 유지: %s", self._platform, raw)
+            await self.on_master_message(raw, None)
+            return
+
+        msg_type = payload.get("type")
+        if msg_type != "message":
+            LOGGER.debug("[%s] 알 수 없는 메시지 타입: %s", self._platform, payload)
+            return
+
+        body = payload.get("payload")
+        bridge_payload: Any
+        if isinstance(body, str):
+            bridge_payload = self._try_parse(body)
+        else:
+            bridge_payload = body
+        await self.on_master_message(payload, bridge_payload)
 
     async def send_to_master(self, payload: Any) -> None:
         if self._ws is None or self._ws.closed:
             raise MasterBridgeError("마스터와 연결되지 않았습니다.")
         message = payload
-        if not isinstance(payload, str):
-            message = json.dumps(payload)
-        await self._ws.send(message)
+        if not isinstance(payload, (str, bytes)):
+            message = json_dumps(payload)
+        await self._outbox.put(message)
+
+    async def _drain_outbox(self, websocket: websockets.WebSocketClientProtocol) -> None:
+        while True:
+            message = await self._outbox.get()
+            await websocket.send(message)
 
     async def on_master_connected(self) -> None:
         """마스터 서버에 접속한 직후 호출."""
@@ -109,22 +196,26 @@ class MasterBridge(abc.ABC):
         """마스터 서버에서 브로드캐스트된 메시지를 처리."""
 
     def _try_parse(self, text: str) -> Any:
+        # JSON 문서로 시작하지 않는 일반 텍스트는 파서를 태우지 않는다.
+        if not text or text[0] not in "{[":
+            return text
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+            return json_loads(text)
+        except ValueError:
             return text
 
 
+def _log_bridge_failure(task: asyncio.Task) -> None:
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        LOGGER.error("[%s] 브릿지 실행 중 오류 발생", task.get_name(), exc_info=exc)
+
+
 async def run_bridges(*bridges: MasterBridge) -> None:
     """여러 브릿지를 동시에 실행."""
-
-    async def _runner(bridge: MasterBridge) -> None:
-        try:
-            await bridge.start()
-        except asyncio.CancelledError:
-            raise
-        except Exception:  # noqa: BLE001
-            LOGGER.exception("[%s] 브릿지 실행 중 오류 발생", bridge.platform)
-            raise
-
-    await asyncio.gather(*(_runner(bridge) for bridge in bridges))
+    async with asyncio.TaskGroup() as tg:
+        for bridge in bridges:
+            task = tg.create_task(bridge.start(), name=f"bridge-{bridge.platform}")
+            task.add_done_callback(_log_bridge_failure)
@@ -6,6 +6,7 @@ import argparse
 import asyncio
 import logging
 import os
+import sys
 from typing import Sequence
 
 from .base import run_bridges
@@ -15,7 +16,32 @@ from .telegram import TelegramBridge
 LOGGER = logging.getLogger(__name__)
 
 
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "").lower() in {"1", "true", "yes"}
+
+
+def _env_namespace() -> argparse.Namespace:
+    """플래그 없이 기동할 때 argparse 구성 비용을 건너뛰는 env 전용 경로."""
+    return argparse.Namespace(
+        master_host=os.getenv("MASTER_HOST", "127.0.0.1"),
+        master_port=int(os.getenv("MASTER_PORT", "8765")),
+        log_level=os.getenv("BRIDGE_LOG_LEVEL", "INFO"),
+        slack_bot_token=os.getenv("SLACK_BOT_TOKEN"),
+        slack_default_channel=os.getenv("SLACK_DEFAULT_CHANNEL"),
+        slack_include_raw=_env_flag("SLACK_INCLUDE_RAW"),
+        telegram_bot_token=os.getenv("TELEGRAM_BOT_TOKEN"),
+        telegram_parse_mode=os.getenv("TELEGRAM_PARSE_MODE"),
+        telegram_allowed_chats=os.getenv("TELEGRAM_ALLOWED_CHATS"),
+        telegram_include_raw=_env_flag("TELEGRAM_INCLUDE_RAW"),
+    )
+
+
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    # 컨테이너처럼 모든 설정이 env로 들어오는 경우 파서 구성을 생략한다.
+    # 인자가 하나라도 있으면(-h, 오타 포함) 파서가 도움말/오류를 처리해야 한다.
+    if argv is None and not sys.argv[1:]:
+        return _env_namespace()
+
     parser = argparse.ArgumentParser(description="Codernetes 마스터 플랫폼 브릿지")
     parser.add_argument("--master-host", default=os.getenv("MASTER_HOST", "127.0.0.1"), help="마스터 서버 호스트")
     parser.add_argument("--master-port", type=int, default=int(os.getenv("MASTER_PORT", "8765")), help="마스터 서버 포트")
@@ -23,6 +49,12 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
 
     parser.add_argument("--slack-bot-token", default=os.getenv("SLACK_BOT_TOKEN"), help="Slack 봇 토큰 (xoxb-)")
     parser.add_argument("--slack-default-channel", default=os.getenv("SLACK_DEFAULT_CHANNEL"), help="Slack 기본 응답 채널")
+    parser.add_argument(
+        "--slack-include-raw",
+        action="store_true",
+        default=_env_flag("SLACK_INCLUDE_RAW"),
+        help="Slack 원본 이벤트를 마스터로 함께 전달 (디버그용)",
+    )
 
     parser.add_argument("--telegram-bot-token", default=os.getenv("TELEGRAM_BOT_TOKEN"), help="Telegram 봇 토큰")
     parser.add_argument("--telegram-parse-mode", default=os.getenv("TELEGRAM_PARSE_MODE"), help="Telegram 메시지 parse_mode")
@@ -31,6 +63,12 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=os.getenv("TELEGRAM_ALLOWED_CHATS"),
         help="허용할 Telegram chat_id 목록(콤마 구분)",
     )
+    parser.add_argument(
+        "--telegram-include-raw",
+        action="store_true",
+        default=_env_flag("TELEGRAM_INCLUDE_RAW"),
+        help="Telegram 원본 업데이트를 마스터로 함께 전달 (디버그용)",
+    )
     return parser.parse_args(argv)
 
 
@@ -48,16 +86,17 @@ def build_bridges(args: argparse.Namespace) -> list:
                 port=args.master_port,
                 bot_token=args.slack_bot_token,
                 default_channel=args.slack_default_channel,
+                include_raw=args.slack_include_raw,
             )
         )
     if args.telegram_bot_token:
         allowed_chats = None
         if args.telegram_allowed_chats:
-            allowed_chats = {
+            allowed_chats = frozenset(
                 int(item)
                 for part in args.telegram_allowed_chats.split(",")
                 if (item := part.strip())
-            }
+            )
         bridges.append(
             TelegramBridge(
                 host=args.master_host,
@@ -65,6 +104,7 @@ def build_bridges(args: argparse.Namespace) -> list:
                 bot_token=args.telegram_bot_token,
                 parse_mode=args.telegram_parse_mode,
                 allowed_chats=allowed_chats,
+                include_raw=args.telegram_include_raw,
             )
         )
     return bridges
@@ -79,8 +119,16 @@ def main(argv: Sequence[str] | None = None) -> int:
         LOGGER.error("활성화할 브릿지가 없습니다. Slack/Telegram 토큰을 확인하세요.")
         return 1
 
+    async def _entry() -> None:
+        # Python 3.12+: eager task factory로 첫 스텝이 동기 완료되는 태스크의
+        # 스케줄러 홉을 제거한다. 미지원 버전에서는 조용히 건너뛴다.
+        eager_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_factory is not None:
+            asyncio.get_running_loop().set_task_factory(eager_factory)
+        await run_bridges(*bridges)
+
     try:
-        asyncio.run(run_bridges(*bridges))
+        asyncio.run(_entry())
     except KeyboardInterrupt:
         LOGGER.info("브릿지가 사용자 요청으로 종료되었습니다.")
         return 0
@@ -3,19 +3,37 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-import time
+import re
 from contextlib import suppress
 from typing import Any
 
 import aiohttp
 import websockets
 
-from .base import MasterBridge, MasterBridgeError
+from .base import MasterBridge, MasterBridgeError, json_dumps, json_loads, json_serialize
 
 LOGGER = logging.getLogger(__name__)
 
+# repo=/repos=/repo:, tags=, target= 플래그 토큰을 한 번의 스캔으로 추출한다.
+_COMMAND_RE = re.compile(
+    r"(?<!\S)(?:"
+    r"(?:(?i:repos?)=|(?i:repo):)(?P<repo>\S*)"
+    r"|(?i:tags)=(?P<tags>\S*)"
+    r"|(?i:target)=(?P<target>\S*)"
+    r")(?!\S)"
+)
+
+# 멘션을 요구하는 채널 유형 (호출마다 set 리터럴을 만들지 않도록 상수화).
+_MENTIONED_CHANNEL_TYPES = frozenset({"channel", "group"})
+
+# Slack 채널 ID 접두사 -> 채널 유형 매핑.
+_CHANNEL_PREFIX_MAP = {"D": "im", "G": "group", "C": "channel"}
+
+# 스키마가 고정된 keepalive 프레임은 매번 직렬화하지 않는다.
+_PING_TEMPLATE = '{"id":%d,"type":"ping"}'
+_PONG_NO_ID = '{"type":"pong"}'
+
 _SLACK_RTM_CONNECT = "https://slack.com/api/rtm.connect"
 _SLACK_CHAT_POST_MESSAGE = "https://slack.com/api/chat.postMessage"
 _SLACK_AUTH_TEST = "https://slack.com/api/auth.test"
@@ -24,18 +42,59 @@ _SLACK_AUTH_TEST = "https://slack.com/api/auth.test"
 class SlackBridge(MasterBridge):
     """Slack Bot 토큰을 사용해 메시지를 중계한다."""
 
-    def __init__(self, host: str, port: int, bot_token: str, *, default_channel: str | None = None) -> None:
+    __slots__ = (
+        "_bot_token",
+        "_auth_headers",
+        "_post_headers",
+        "_default_channel",
+        "_session",
+        "_bot_user_id",
+        "_bot_team_id",
+        "_mention",
+        "_mention_len",
+        "_slack_stop",
+        "_ping_id",
+        "_include_raw",
+    )
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        bot_token: str,
+        *,
+        default_channel: str | None = None,
+        include_raw: bool = False,
+    ) -> None:
         super().__init__(host, port, platform="slack")
         self._bot_token = bot_token
+        self._auth_headers = {"Authorization": f"Bearer {bot_token}"}
+        self._post_headers = {
+            **self._auth_headers,
+            "Content-Type": "application/json; charset=utf-8",
+        }
         self._default_channel = default_channel
         self._session: aiohttp.ClientSession | None = None
         self._bot_user_id: str | None = None
         self._bot_team_id: str | None = None
+        self._mention: str | None = None
+        self._mention_len = 0
         self._slack_stop = asyncio.Event()
         self._ping_id = 0
+        self._include_raw = include_raw
 
     async def start(self) -> None:  # type: ignore[override]
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+        connector = aiohttp.TCPConnector(
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+        )
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30),
+            connector=connector,
+            json_serialize=json_serialize,
+        ) as session:
             self._session = session
             await self._hydrate_identity()
             await asyncio.gather(
@@ -81,21 +140,22 @@ class SlackBridge(MasterBridge):
     async def _hydrate_identity(self) -> None:
         if self._session is None:
             raise MasterBridgeError("세션이 초기화되지 않았습니다.")
-        headers = {"Authorization": f"Bearer {self._bot_token}"}
-        async with self._session.post(_SLACK_AUTH_TEST, headers=headers) as resp:
+        async with self._session.post(_SLACK_AUTH_TEST, headers=self._auth_headers) as resp:
             data = await resp.json()
             if not data.get("ok"):
                 raise MasterBridgeError(f"Slack auth.test 실패: {data}")
             self._bot_user_id = data.get("user_id")
             self._bot_team_id = data.get("team_id")
+            if self._bot_user_id:
+                self._mention = f"<@{self._bot_user_id}>"
+                self._mention_len = len(self._mention)
             LOGGER.info("Slack 봇 사용자: %s (team=%s)", self._bot_user_id, self._bot_team_id)
 
     async def _slack_loop(self) -> None:
         assert self._session is not None
-        headers = {"Authorization": f"Bearer {self._bot_token}"}
         while not self._slack_stop.is_set():
             try:
-                url = await self._rtm_connect(headers)
+                url = await self._rtm_connect(self._auth_headers)
                 await self._consume_rtm(url)
             except asyncio.CancelledError:
                 raise
@@ -120,8 +180,8 @@ class SlackBridge(MasterBridge):
                     if not raw:
                         continue
                     try:
-                        event = json.loads(raw)
-                    except json.JSONDecodeError:
+                        event = json_loads(raw)
+                    except ValueError:
                         LOGGER.debug("Slack 이벤트 파싱 실패: %s", raw)
                         continue
 
@@ -131,10 +191,10 @@ class SlackBridge(MasterBridge):
                         continue
                     if etype == "ping":
                         reply_to = event.get("id")
-                        payload = {"type": "pong"}
-                        if reply_to is not None:
-                            payload["reply_to"] = reply_to
-                        await slack_ws.send(json.dumps(payload))
+                        if reply_to is None:
+                            await slack_ws.send(_PONG_NO_ID)
+                        else:
+                            await slack_ws.send(json_dumps({"type": "pong", "reply_to": reply_to}))
                         continue
                     if etype == "message":
                         await self._handle_slack_message(event)
@@ -151,12 +211,16 @@ class SlackBridge(MasterBridge):
                     await ping_task
 
     async def _ping_loop(self, slack_ws: Any) -> None:
-        while not slack_ws.closed:
-            await asyncio.sleep(30)
+        while not self._slack_stop.is_set():
+            # stop 이벤트를 기다리며 잠들기 때문에 종료 시 최대 30초 지연이 없다.
+            try:
+                await asyncio.wait_for(self._slack_stop.wait(), timeout=30)
+                return
+            except asyncio.TimeoutError:
+                pass
             self._ping_id += 1
-            payload = {"id": self._ping_id, "type": "ping", "time": time.time()}
             try:
-                await slack_ws.send(json.dumps(payload))
+                await slack_ws.send(_PING_TEMPLATE % self._ping_id)
             except Exception as exc:  # noqa: BLE001
                 LOGGER.debug("Slack ping 전송 실패: %s", exc)
                 return
@@ -182,11 +246,14 @@ class SlackBridge(MasterBridge):
         if not channel_type:
             channel_type = self._guess_channel_type(channel)
 
-        if channel_type in {"channel", "group"}:
-            if not self._bot_user_id:
+        if channel_type in _MENTIONED_CHANNEL_TYPES:
+            mention = self._mention
+            if mention is None:
                 return
-            mention = f"<@{self._bot_user_id}>"
-            if mention in text:
+            if text.startswith(mention):
+                # 멘션이 맨 앞에 오는 일반적인 경우: 전체 스캔 없이 잘라낸다.
+                text = text[self._mention_len :].strip()
+            elif mention in text:
                 text = text.replace(mention, "", 1).strip()
             else:
                 return
@@ -207,8 +274,9 @@ class SlackBridge(MasterBridge):
             },
             "text": text,
             "command": command,
-            "raw_event": event,
         }
+        if self._include_raw:
+            payload["raw_event"] = event
         await self._forward_to_master(payload)
 
     async def _forward_to_master(self, payload: dict[str, Any]) -> None:
@@ -222,53 +290,33 @@ class SlackBridge(MasterBridge):
             body["thread_ts"] = thread_ts
             if broadcast:
                 body["reply_broadcast"] = True
-        headers = {
-            "Authorization": f"Bearer {self._bot_token}",
-            "Content-Type": "application/json; charset=utf-8",
-        }
-        async with self._session.post(_SLACK_CHAT_POST_MESSAGE, headers=headers, json=body) as resp:
+        async with self._session.post(_SLACK_CHAT_POST_MESSAGE, headers=self._post_headers, json=body) as resp:
             data = await resp.json()
             if not data.get("ok"):
                 LOGGER.error("Slack 메시지 전송 실패: %s", data)
 
     def _guess_channel_type(self, channel_id: str) -> str:
-        if channel_id.startswith("D"):
-            return "im"
-        if channel_id.startswith("G"):
-            return "group"
-        if channel_id.startswith("C"):
-            return "channel"
-        return "unknown"
+        return _CHANNEL_PREFIX_MAP.get(channel_id[:1], "unknown")
 
     def _parse_command(self, text: str) -> dict[str, Any]:
-        tokens = text.split()
         repos = []
         tags = []
         target = None
-        prompt_tokens: list[str] = []
-        for token in tokens:
-            lower = token.lower()
-            if lower.startswith("repo=") or lower.startswith("repos="):
-                _, value = token.split("=", 1)
-                if value:
-                    repos.append({"url": value})
-                continue
-            if lower.startswith("repo:"):
-                _, value = token.split(":", 1)
-                if value:
-                    repos.append({"url": value})
-                continue
-            if lower.startswith("tags="):
-                _, value = token.split("=", 1)
-                tags.extend([tag.strip() for tag in value.split(",") if tag.strip()])
+        for match in _COMMAND_RE.finditer(text):
+            repo_value = match.group("repo")
+            if repo_value is not None:
+                if repo_value:
+                    repos.append({"url": repo_value})
                 continue
-            if lower.startswith("target="):
-                _, value = token.split("=", 1)
-                target = value.strip()
+            tags_value = match.group("tags")
+            if tags_value is not None:
+                tags.extend([tag.strip() for tag in tags_value.split(",") if tag.strip()])
                 continue
-            prompt_tokens.append(token)
+            target_value = match.group("target")
+            if target_value:
+                target = target_value
 
-        prompt = " ".join(prompt_tokens).strip() or text
+        prompt = " ".join(_COMMAND_RE.sub(" ", text).split()) or text
         return {
             "prompt": prompt,
             "repositories": repos,
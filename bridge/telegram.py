@@ -4,18 +4,42 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 import aiohttp
+from yarl import URL
 
-from .base import MasterBridge, MasterBridgeError
+try:  # ijson이 있으면 getUpdates 응답을 도착하는 대로 증분 파싱한다.
+    import ijson
+except ImportError:  # pragma: no cover - 선택 의존성
+    ijson = None
+
+from .base import MasterBridge, MasterBridgeError, json_loads, json_serialize
 
 LOGGER = logging.getLogger(__name__)
 
+# source 필드 중 이벤트에서 1:1로 옮기는 키 (zip+map이 키별 대입보다 싸다).
+_USER_SOURCE_FIELDS = ("user_id", "username", "first_name", "last_name")
+_USER_SOURCE_KEYS = ("id", "username", "first_name", "last_name")
+_MESSAGE_SOURCE_KEYS = ("message_id", "message_thread_id")
+
 
 class TelegramBridge(MasterBridge):
     """Telegram Bot API 기반 중계."""
 
+    __slots__ = (
+        "_bot_token",
+        "_api_base_url",
+        "_parse_mode",
+        "_allowed_chats",
+        "_session",
+        "_stop_poll",
+        "_update_offset",
+        "_bot_username",
+        "_include_raw",
+    )
+
     api_base = "https://api.telegram.org"
 
     def __init__(
@@ -26,19 +50,31 @@ class TelegramBridge(MasterBridge):
         *,
         parse_mode: str | None = None,
         allowed_chats: set[int] | None = None,
+        include_raw: bool = False,
     ) -> None:
         super().__init__(host, port, platform="telegram")
         self._bot_token = bot_token
+        # yarl URL을 미리 파싱해 두면 `/ method` 결합 시 전체 파서를 다시 타지 않는다.
+        self._api_base_url = URL(f"{self.api_base}/bot{bot_token}/")
         self._parse_mode = parse_mode
         self._allowed_chats = allowed_chats
         self._session: aiohttp.ClientSession | None = None
         self._stop_poll = asyncio.Event()
         self._update_offset: int | None = None
         self._bot_username: str | None = None
+        self._include_raw = include_raw
 
     async def start(self) -> None:  # type: ignore[override]
         timeout = aiohttp.ClientTimeout(total=40)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        connector = aiohttp.TCPConnector(
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+        )
+        async with aiohttp.ClientSession(
+            timeout=timeout, connector=connector, json_serialize=json_serialize
+        ) as session:
             self._session = session
             await self._hydrate_bot()
             await asyncio.gather(
@@ -90,25 +126,44 @@ class TelegramBridge(MasterBridge):
     async def _poll_updates(self) -> None:
         while not self._stop_poll.is_set():
             try:
-                updates = await self._get_updates()
+                # offset은 디스패치 전에 전진시키므로 핸들러를 겹쳐 실행해도 안전하다.
+                async with asyncio.TaskGroup() as tg:
+                    async for update in self._stream_updates():
+                        update_id = update.get("update_id")
+                        if update_id is not None:
+                            self._update_offset = update_id + 1
+                        tg.create_task(self._handle_update(update))
             except asyncio.CancelledError:
                 raise
             except Exception as exc:  # noqa: BLE001
                 LOGGER.warning("Telegram 업데이트 수신 실패: %s", exc)
                 await asyncio.sleep(3)
-                continue
 
-            for update in updates:
-                update_id = update.get("update_id")
-                if update_id is not None:
-                    self._update_offset = update_id + 1
-                await self._handle_update(update)
-
-    async def _get_updates(self) -> list[dict[str, Any]]:
+    def _updates_payload(self) -> dict[str, Any]:
         payload: dict[str, Any] = {"timeout": 30, "allowed_updates": ["message"]}
         if self._update_offset is not None:
             payload["offset"] = self._update_offset
-        resp = await self._telegram_request("getUpdates", json=payload)
+        return payload
+
+    async def _stream_updates(self) -> AsyncIterator[dict[str, Any]]:
+        """getUpdates 응답을 전체 버퍼링 없이 update 단위로 돌려준다."""
+        if ijson is None:
+            for update in await self._get_updates():
+                yield update
+            return
+
+        if self._session is None:
+            raise MasterBridgeError("세션이 초기화되지 않았습니다.")
+        url = self._api_base_url / "getUpdates"
+        async with self._session.post(url, json=self._updates_payload()) as resp:
+            if resp.status != 200:
+                body = await resp.json(loads=json_loads)
+                raise MasterBridgeError(f"Telegram API 오류(getUpdates): {body}")
+            async for update in ijson.items(resp.content, "result.item"):
+                yield update
+
+    async def _get_updates(self) -> list[dict[str, Any]]:
+        resp = await self._telegram_request("getUpdates", json=self._updates_payload())
         if not isinstance(resp, list):
             raise MasterBridgeError(f"getUpdates 응답 오류: {resp}")
         return resp
@@ -127,28 +182,28 @@ class TelegramBridge(MasterBridge):
         if chat_id is None:
             return
 
-        if self._allowed_chats is not None and int(chat_id) not in self._allowed_chats:
-            LOGGER.debug("허용되지 않은 채팅 %s, 무시", chat_id)
-            return
+        if self._allowed_chats is not None:
+            # int 변환은 허용 목록이 있을 때만 수행한다.
+            if int(chat_id) not in self._allowed_chats:
+                LOGGER.debug("허용되지 않은 채팅 %s, 무시", chat_id)
+                return
 
         from_user = message.get("from") or {}
+        source: dict[str, Any] = {
+            "platform": "telegram",
+            "chat_id": chat_id,
+            "chat_type": chat.get("type"),
+        }
+        source.update(zip(_USER_SOURCE_FIELDS, map(from_user.get, _USER_SOURCE_KEYS)))
+        source.update(zip(_MESSAGE_SOURCE_KEYS, map(message.get, _MESSAGE_SOURCE_KEYS)))
         payload = {
             "type": "command",
-            "source": {
-                "platform": "telegram",
-                "chat_id": chat_id,
-                "chat_type": chat.get("type"),
-                "user_id": from_user.get("id"),
-                "username": from_user.get("username"),
-                "first_name": from_user.get("first_name"),
-                "last_name": from_user.get("last_name"),
-                "message_id": message.get("message_id"),
-                "message_thread_id": message.get("message_thread_id"),
-            },
+            "source": source,
             "text": text,
             "command": self._parse_command(text),
-            "raw_update": update,
         }
+        if self._include_raw:
+            payload["raw_update"] = update
         try:
             await self._forward_to_master(payload)
         except MasterBridgeError as exc:
@@ -214,9 +269,9 @@ class TelegramBridge(MasterBridge):
     async def _telegram_request(self, method: str, params: dict[str, Any] | None = None, json: dict[str, Any] | None = None) -> Any:
         if self._session is None:
             raise MasterBridgeError("세션이 초기화되지 않았습니다.")
-        url = f"{self.api_base}/bot{self._bot_token}/{method}"
+        url = self._api_base_url / method
         async with self._session.post(url, params=params, json=json) as resp:
-            body = await resp.json()
+            body = await resp.json(loads=json_loads)
             if not body.get("ok"):
                 raise MasterBridgeError(f"Telegram API 오류({method}): {body}")
             return body.get("result")
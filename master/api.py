@@ -2,22 +2,108 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 import uuid
-from datetime import datetime
+from collections.abc import Callable
+from contextlib import suppress
+from datetime import datetime, timezone
 from typing import Any
 
+import aiohttp
 from aiohttp import web
 
-from .models import Job, JobStatus, RepositorySpec
+from .models import STATUS_BY_VALUE, Job, JobStatus, RepositorySpec
+from .serialization import json_dumps, json_loads, json_response
 from .storage import Storage
 
+# 종료 상태의 작업은 페이로드가 다시 바뀌지 않으므로 직렬화 결과를 재사용할 수 있다.
+_TERMINAL_STATUSES = frozenset({JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED})
+_TERMINAL_STATUS_VALUES = frozenset(status.value for status in _TERMINAL_STATUSES)
+_JOB_CACHE_LIMIT = 4096
+
+# 같은 사용자에 대한 GitHub 레포 목록은 60초간 재사용한다.
+_REPO_CACHE_TTL = 60.0
+
+# 버전 카운터는 프로세스 재시작 시 0부터 다시 시작하므로, ETag에 기동마다
+# 바뀌는 토큰을 섞어 이전 프로세스의 ETag가 재검증되는 일을 막는다.
+_ETAG_EPOCH = uuid.uuid4().hex[:8]
+
+
+# GitHub 연동 전까지의 플레이스홀더 목록은 import 시 한 번만 렌더링한다.
+_PLACEHOLDER_REPOS_TEMPLATE = json_dumps(
+    [
+        {
+            "name": "example-repo",
+            "full_name": "__USER__/example-repo",
+            "url": "https://github.com/example/example-repo",
+            "default_branch": "main",
+        },
+        {
+            "name": "codernetes-tasks",
+            "full_name": "__USER__/codernetes-tasks",
+            "url": "https://github.com/example/codernetes-tasks",
+            "default_branch": "main",
+        },
+    ]
+)
+
+
+async def _read_json(request: web.Request) -> dict[str, Any]:
+    """본문을 읽어 JSON 객체로 해석한다 (content-type 스니핑 없이)."""
+    raw = await request.read()
+    try:
+        data = json_loads(raw)
+    except ValueError:
+        raise web.HTTPBadRequest(text="invalid json") from None
+    if not isinstance(data, dict):
+        raise web.HTTPBadRequest(text="invalid json")
+    return data
+
+
+def _parse_repositories(raw: Any) -> list[RepositorySpec]:
+    if not isinstance(raw, list):
+        return []
+    return [
+        RepositorySpec(
+            url=str(repo.get("url")),
+            branch=repo.get("branch"),
+            subdirectory=repo.get("subdirectory"),
+        )
+        for repo in raw
+        if isinstance(repo, dict) and repo.get("url")
+    ]
+
+
+def _parse_tags(raw: Any) -> list[str]:
+    if not isinstance(raw, list):
+        return []
+    return [tag.strip() for tag in raw if isinstance(tag, str) and tag.strip()]
+
+
+def _parse_datetime(raw: Any) -> datetime | None:
+    if not raw:
+        return None
+    try:
+        return datetime.fromisoformat(str(raw))
+    except ValueError:
+        return None
+
 
 class ApiHandler:
-    def __init__(self, storage: Storage) -> None:
+    def __init__(self, storage: Storage, *, on_jobs_changed: Callable[[], None] | None = None) -> None:
         self._storage = storage
-
-    def routes(self) -> tuple[web.RouteDef, ...]:
-        return (
+        # 작업 생성/상태 변경 시 디스패처를 깨우기 위한 콜백.
+        self._on_jobs_changed = on_jobs_changed
+        # 종료 상태 작업의 렌더링된 JSON 조각 ((job_id, 버전) -> bytes).
+        # 버전을 키에 포함해 WS 경로의 상태 갱신도 별도 무효화 없이 반영된다.
+        self._job_fragment_cache: dict[tuple[str, int], bytes] = {}
+        self._http: aiohttp.ClientSession | None = None
+        # 동시 요청 병합: 같은 user_id의 업스트림 호출은 한 번만 나간다.
+        self._repo_inflight: dict[str, asyncio.Future[list[dict[str, Any]]]] = {}
+        self._repo_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+        # 라우트 튜플은 한 번만 구성한다 (호출마다 바운드 메서드를 새로 만들지 않는다).
+        self._routes = (
             web.get("/api/jobs", self.list_jobs),
             web.get("/api/jobs/{job_id}", self.get_job),
             web.post("/api/jobs", self.create_job),
@@ -28,81 +114,135 @@ class ApiHandler:
             web.get("/api/github/repos", self.list_github_repos),
         )
 
+    def routes(self) -> tuple[web.RouteDef, ...]:
+        return self._routes
+
+    async def on_startup(self, _: web.Application) -> None:
+        # GitHub API 호출용 장수 세션: 요청마다 TCP+TLS 핸드셰이크를 다시 내지 않는다.
+        self._http = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=10),
+        )
+
+    async def on_cleanup(self, _: web.Application) -> None:
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+
     async def list_jobs(self, request: web.Request) -> web.Response:
         status_param = request.query.get("status")
-        status = JobStatus(status_param) if status_param else None
-        jobs = self._storage.list_jobs(limit=100, status=status)
-        payload = [self._job_to_dict(job) for job in jobs]
-        return web.json_response({"jobs": payload})
+        status = None
+        if status_param:
+            status = STATUS_BY_VALUE.get(status_param)
+            if status is None:
+                raise web.HTTPBadRequest(text="invalid status")
+
+        # 변경이 없었으면 직렬화 없이 304로 끝낸다. 버전 카운터는 재기동 시
+        # 0부터 다시 세므로 부팅 토큰을 섞어 재기동 이전 ETag를 무효화한다.
+        etag = f'W/"{_ETAG_EPOCH}-{self._storage.jobs_version}-{status_param or "all"}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304)
+
+        # Job/RepositorySpec 객체를 만들지 않고 행에서 페이로드를 바로 구성한다.
+        payloads = await self._storage.run_read(self._storage.list_job_payloads, limit=100, status=status)
+        # 큰 목록 인코딩은 스레드로 넘겨 이벤트 루프를 막지 않는다 (orjson은 GIL을 푼다).
+        body = await asyncio.get_running_loop().run_in_executor(
+            None, self._render_jobs_body, payloads
+        )
+        return web.Response(body=body, content_type="application/json", headers={"ETag": etag})
+
+    def _render_jobs_body(self, payloads: list[dict[str, object]]) -> bytes:
+        fragments = [self._job_fragment(payload) for payload in payloads]
+        return b'{"jobs":[' + b",".join(fragments) + b"]}"
+
+    def _job_fragment(self, payload: dict[str, Any]) -> bytes:
+        """작업 하나를 JSON 조각으로 렌더링한다 (종료 상태는 캐시 재사용)."""
+        if payload["status"] not in _TERMINAL_STATUS_VALUES:
+            return json_dumps(payload)
+        job_id = payload["job_id"]
+        key = (job_id, self._storage.job_version(job_id))
+        cached = self._job_fragment_cache.get(key)
+        if cached is None:
+            cached = json_dumps(payload)
+            if len(self._job_fragment_cache) >= _JOB_CACHE_LIMIT:
+                # dict는 삽입 순서를 유지하므로 가장 오래된 항목부터 비운다.
+                # 실행자 스레드 여러 개가 동시에 올 수 있으니 같은 키를 두 번
+                # 지워도(기본값), 그 사이 dict가 비거나 바뀌어도 넘어간다.
+                with suppress(StopIteration, RuntimeError):
+                    self._job_fragment_cache.pop(next(iter(self._job_fragment_cache)), None)
+            self._job_fragment_cache[key] = cached
+        return cached
 
     async def get_job(self, request: web.Request) -> web.Response:
         job_id = request.match_info["job_id"]
-        job = self._storage.get_job(job_id)
+        # 존재 확인 전에 ETag를 검증하면 없는 작업에도 304가 나간다 —
+        # 행을 먼저 읽고, 있는 작업에 대해서만 조건부 응답을 처리한다.
+        job = await self._storage.run_read(self._storage.get_job, job_id)
         if job is None:
             raise web.HTTPNotFound(text="job not found")
-        return web.json_response({"job": self._job_to_dict(job)})
+        etag = f'W/"{_ETAG_EPOCH}-{job_id}-{self._storage.job_version(job_id)}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304)
+
+        body = b'{"job":' + self._job_fragment(self._job_to_dict(job)) + b"}"
+        return web.Response(body=body, content_type="application/json", headers={"ETag": etag})
 
     async def create_job(self, request: web.Request) -> web.Response:
-        try:
-            data = await request.json()
-        except Exception:  # noqa: BLE001
-            raise web.HTTPBadRequest(text="invalid json") from None
+        data = await _read_json(request)
 
         prompt = str(data.get("prompt", "")).strip()
         if not prompt:
             raise web.HTTPBadRequest(text="prompt is required")
 
-        repositories = [
-            RepositorySpec(url=str(repo.get("url")), branch=repo.get("branch"), subdirectory=repo.get("subdirectory"))
-            for repo in data.get("repositories", [])
-            if repo.get("url")
-        ]
-        requested_tags = [tag.strip() for tag in data.get("requested_tags", []) if tag.strip()]
+        repositories = _parse_repositories(data.get("repositories"))
+        requested_tags = _parse_tags(data.get("requested_tags"))
         target_node = str(data.get("target_node_id")) if data.get("target_node_id") else None
 
         job = Job(
-            job_id=str(uuid.uuid4()),
+            job_id=uuid.uuid4().hex,
             prompt=prompt,
-            created_at=datetime.utcnow(),
+            created_at=datetime.now(timezone.utc),
             status=JobStatus.QUEUED if target_node else JobStatus.PENDING,
             target_node_id=target_node,
             requested_tags=requested_tags,
             repositories=repositories,
             metadata={"origin": data.get("origin", "api")},
         )
-        self._storage.upsert_job(job)
-        return web.json_response({"job": self._job_to_dict(job)}, status=201)
+        await self._storage.run_write(self._storage.upsert_job, job)
+        if self._on_jobs_changed is not None:
+            self._on_jobs_changed()
+        return json_response({"job": self._job_to_dict(job)}, status=201)
 
     async def update_job_status(self, request: web.Request) -> web.Response:
         job_id = request.match_info["job_id"]
-        try:
-            data = await request.json()
-        except Exception:  # noqa: BLE001
-            raise web.HTTPBadRequest(text="invalid json") from None
+        data = await _read_json(request)
 
         status_value = data.get("status")
         if not status_value:
             raise web.HTTPBadRequest(text="status is required")
 
-        try:
-            status = JobStatus(status_value)
-        except ValueError as exc:
-            raise web.HTTPBadRequest(text="invalid status") from exc
+        status = STATUS_BY_VALUE.get(status_value)
+        if status is None:
+            raise web.HTTPBadRequest(text="invalid status")
 
-        self._storage.update_job_status(
+        await self._storage.run_write(
+            self._storage.update_job_status,
             job_id,
             status,
             log_path=data.get("log_path"),
             result_summary=data.get("result_summary"),
             error_message=data.get("error_message"),
         )
-        job = self._storage.get_job(job_id)
+        if self._on_jobs_changed is not None:
+            self._on_jobs_changed()
+        job = await self._storage.run_read(self._storage.get_job, job_id)
         if job is None:
             raise web.HTTPNotFound(text="job not found")
-        return web.json_response({"job": self._job_to_dict(job)})
+        body = b'{"job":' + self._job_fragment(self._job_to_dict(job)) + b"}"
+        return web.Response(body=body, content_type="application/json")
 
     async def list_nodes(self, _: web.Request) -> web.Response:
-        nodes = self._storage.list_nodes()
+        nodes = await self._storage.run_read(self._storage.list_nodes)
         payload = [
             {
                 "node_id": node.node_id,
@@ -114,25 +254,33 @@ class ApiHandler:
             }
             for node in nodes
         ]
-        return web.json_response({"nodes": payload})
+        return json_response({"nodes": payload})
 
-    async def list_job_logs(self, request: web.Request) -> web.Response:
+    async def list_job_logs(self, request: web.Request) -> web.StreamResponse:
         job_id = request.match_info["job_id"]
-        job = self._storage.get_job(job_id)
+        job = await self._storage.run_read(self._storage.get_job, job_id)
         if job is None:
             raise web.HTTPNotFound(text="job not found")
 
         limit = min(int(request.query.get("limit", 200)), 1000)
         after_seq = request.query.get("after")
         after_value = int(after_seq) if after_seq is not None else None
-        logs = self._storage.list_job_logs(job_id, limit=limit, after_seq=after_value)
-        return web.json_response({"logs": logs})
+
+        # 버퍼 플러시와 행 조회는 읽기 실행자에서 수행하고, 루프에서는
+        # 가져온 행을 NDJSON으로 흘려보내기만 한다.
+        rows = await self._storage.run_read(
+            self._storage.list_job_logs, job_id, limit=limit, after_seq=after_value
+        )
+        response = web.StreamResponse()
+        response.content_type = "application/x-ndjson"
+        await response.prepare(request)
+        for row in rows:
+            await response.write(json_dumps(row) + b"\n")
+        await response.write_eof()
+        return response
 
     async def set_github_token(self, request: web.Request) -> web.Response:
-        try:
-            data = await request.json()
-        except Exception:  # noqa: BLE001
-            raise web.HTTPBadRequest(text="invalid json") from None
+        data = await _read_json(request)
 
         user_id = str(data.get("user_id", "")).strip()
         token = str(data.get("access_token", "")).strip()
@@ -140,19 +288,14 @@ class ApiHandler:
             raise web.HTTPBadRequest(text="user_id and access_token are required")
 
         refresh_token = data.get("refresh_token")
-        expires_at_raw = data.get("expires_at")
-        expires_at = None
-        if expires_at_raw:
-            try:
-                expires_at = datetime.fromisoformat(str(expires_at_raw))
-            except ValueError:
-                pass
+        expires_at = _parse_datetime(data.get("expires_at"))
 
         metadata = {
             "scope": data.get("scope"),
             "token_type": data.get("token_type"),
         }
-        self._storage.set_user_token(
+        await self._storage.run_write(
+            self._storage.set_user_token,
             user_id,
             "github",
             access_token=token,
@@ -160,33 +303,56 @@ class ApiHandler:
             expires_at=expires_at,
             metadata=metadata,
         )
-        return web.json_response({"status": "ok"})
+        return json_response({"status": "ok"})
 
     async def list_github_repos(self, request: web.Request) -> web.Response:
         user_id = request.query.get("user_id")
         if not user_id:
             raise web.HTTPBadRequest(text="user_id query parameter required")
 
-        token_entry = self._storage.get_user_token(user_id, "github")
+        token_entry = await self._storage.run_read(self._storage.get_user_token, user_id, "github")
         if token_entry is None:
             raise web.HTTPUnauthorized(text="GitHub token not found for user")
 
-        # TODO: 실제 GitHub API 호출로 대체
-        placeholder_repos = [
-            {
-                "name": "example-repo",
-                "full_name": f"{user_id}/example-repo",
-                "url": "https://github.com/example/example-repo",
-                "default_branch": "main",
-            },
-            {
-                "name": "codernetes-tasks",
-                "full_name": f"{user_id}/codernetes-tasks",
-                "url": "https://github.com/example/codernetes-tasks",
-                "default_branch": "main",
-            },
-        ]
-        return web.json_response({"repos": placeholder_repos})
+        repos = await self._github_repos(user_id, token_entry)
+        return json_response({"repos": repos})
+
+    async def _github_repos(self, user_id: str, token_entry: dict[str, object]) -> list[dict[str, Any]]:
+        cached = self._repo_cache.get(user_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        # 첫 호출자만 업스트림으로 나가고 나머지는 같은 Future를 기다린다.
+        future = self._repo_inflight.get(user_id)
+        if future is not None:
+            return await future
+
+        future = asyncio.get_running_loop().create_future()
+        self._repo_inflight[user_id] = future
+        try:
+            repos = await self._fetch_github_repos(user_id, token_entry)
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # 대기자가 없어도 미회수 경고를 남기지 않는다.
+            raise
+        else:
+            future.set_result(repos)
+            self._repo_cache[user_id] = (time.monotonic() + _REPO_CACHE_TTL, repos)
+            return repos
+        finally:
+            self._repo_inflight.pop(user_id, None)
+            # 클라이언트 끊김 등으로 핸들러가 취소되면 CancelledError가
+            # 위 except를 지나친다 — 미해결 Future를 취소해 대기 중인
+            # 합류자들이 영원히 멈추지 않게 한다.
+            if not future.done():
+                future.cancel()
+
+    async def _fetch_github_repos(self, user_id: str, token_entry: dict[str, object]) -> list[dict[str, Any]]:
+        # TODO: self._http로 실제 GitHub API 호출로 대체
+        # user_id는 임의 문자열이므로 JSON 이스케이프를 거친 내용만 치환한다.
+        escaped = json_dumps(user_id)[1:-1]
+        body = _PLACEHOLDER_REPOS_TEMPLATE.replace(b"__USER__", escaped)
+        return json_loads(body)
 
     def _job_to_dict(self, job: Job) -> dict[str, Any]:
         return {
@@ -195,7 +361,7 @@ class ApiHandler:
             "status": job.status.value,
             "target_node_id": job.target_node_id,
             "requested_tags": job.requested_tags,
-            "repositories": [repo.__dict__ for repo in job.repositories],
+            "repositories": [repo.to_dict() for repo in job.repositories],
             "metadata": job.metadata,
             "log_path": job.log_path,
             "result_summary": job.result_summary,
@@ -18,6 +18,10 @@ class JobStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# Enum.__call__ 경로를 거치지 않는 값 -> 상태 조회 테이블.
+STATUS_BY_VALUE: dict[str, JobStatus] = {status.value: status for status in JobStatus}
+
+
 @dataclass(slots=True)
 class RepositorySpec:
     """작업에 포함된 GitHub 레포지토리 명세."""
@@ -26,7 +30,14 @@ class RepositorySpec:
     branch: str | None = None
     subdirectory: str | None = None  # Repo 내에서 작업할 경로
 
+    def to_dict(self) -> dict[str, str | None]:
+        # slots=True라 __dict__가 없으므로 직렬화는 이 메서드를 쓴다.
+        return {"url": self.url, "branch": self.branch, "subdirectory": self.subdirectory}
+
 
+# NOTE: msgspec.Struct(gc=False) 전환은 보류. msgspec이 의존성이 아니고,
+# dequeue_pending_job 등이 Job을 제자리에서 변경하므로 frozen 구조와 맞지 않는다.
+# 핫패스 직렬화는 storage.list_job_payloads / api._job_fragment가 이미 우회한다.
 @dataclass(slots=True)
 class Job:
     """Codernetes 작업 기본 모델."""
@@ -0,0 +1,34 @@
+"""마스터 공용 JSON 직렬화 헬퍼."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from aiohttp import web
+
+try:  # orjson이 있으면 C 구현으로 직렬화/파싱 비용을 줄인다.
+    import orjson
+
+    def json_dumps(payload: Any) -> bytes:
+        return orjson.dumps(payload)
+
+    json_loads = orjson.loads
+except ImportError:  # pragma: no cover - 선택 의존성
+
+    def json_dumps(payload: Any) -> bytes:
+        return json.dumps(payload).encode()
+
+    json_loads = json.loads
+
+
+def json_response(payload: Any, *, status: int = 200) -> web.Response:
+    """`web.json_response` 대신 orjson 경로로 바디를 만든다."""
+    body = json_dumps(payload)
+    return web.Response(
+        body=body,
+        status=status,
+        content_type="application/json",
+        # 길이를 미리 박아 chunked 인코딩 경로를 타지 않게 한다.
+        headers={"Content-Length": str(len(body))},
+    )
@@ -4,30 +4,162 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
+import functools
+import hashlib
 import logging
+import mimetypes
 import os
+import random
 import signal
 import sys
 import time
 import uuid
 from contextlib import suppress
-from dataclasses import dataclass, replace
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from http import HTTPStatus
 from pathlib import Path
-from typing import Any, Dict, Optional, Sequence, Tuple
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Sequence, Tuple
 
 from aiohttp import web
-from websockets.asyncio.server import Server, ServerConnection, serve
+from websockets.asyncio.server import Server, ServerConnection, broadcast, serve
 from websockets.exceptions import ConnectionClosed
 
 from .api import ApiHandler
 from .models import Job, JobStatus, NodeMetadata, RepositorySpec
+from .serialization import json_dumps, json_loads, json_response
 from .storage import Storage, init_storage
 
 LOGGER = logging.getLogger(__name__)
 
+# 중계 메시지 프레임의 고정 부분. uid는 서버가 만든 UUID라 이스케이프가 필요 없다.
+_MSG_PREFIX = b'{"type":"message","from":"'
+_MSG_PAYLOAD_SEP = b'","payload":'
+_MSG_SUFFIX = b"}"
+_MASTER_UID = b"master"
+
+# 접속 인사 프레임도 client_id만 끼워 넣으면 되므로 미리 인코딩해 둔다.
+_WELCOME_PREFIX = b'{"type":"welcome","client_id":"'
+_WELCOME_SUFFIX = b'","message":"Connected to Codernetes master"}'
+
+# last_seen만 바뀐 노드 레코드는 이 주기 안에서는 DB에 쓰지 않는다.
+_NODE_PERSIST_DEBOUNCE = 5.0
+
+# 이 크기를 넘는 정적 자산은 메모리에 올리지 않고 FileResponse로 서빙한다.
+_ASSET_CACHE_MAX_BYTES = 5 * 1024 * 1024
+
+# 브로드캐스트 시 한 번에 프레임을 싣는 연결 수. 배치 사이에 루프에 양보한다.
+_BROADCAST_BATCH = 100
+
+# 로그 버퍼 주기 플러시 간격(초). append 경로의 임계치와 별개인 유휴 안전망이다.
+_LOG_FLUSH_INTERVAL = 0.25
+
+# 원격 목록 ETag용 부팅 토큰. _remotes_version은 재기동 시 0부터 다시 세고
+# 목업 uid도 부팅마다 새로 뽑히므로, 이전 프로세스의 ETag를 무효화해야 한다.
+_REMOTES_ETAG_EPOCH = uuid.uuid4().hex[:8]
+
+# 원격 노드 action -> (적용할 status, last_seen 갱신 여부) 디스패치 테이블.
+_REMOTE_ACTIONS: dict[str, tuple[str | None, bool]] = {
+    "mark_online": ("online", True),
+    "mark_offline": ("offline", False),
+    "mark_maintenance": ("maintenance", False),
+    "mark_busy": ("busy", True),
+    "touch": (None, True),
+}
+
+
+# 설정 직렬화마다 같은 입력으로 불리는 순수 함수들 — 결과를 캐싱한다.
+async def _bounded_gather(coros: Iterable[Awaitable[Any]], limit: int = 1024) -> None:
+    """동시 실행 수를 제한한 gather — 대규모 접속에서 한꺼번에 태스크가 몰리는 것을 막는다."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(coro: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await coro
+
+    await asyncio.gather(*(_run(coro) for coro in coros), return_exceptions=True)
+
+
+def _format_ts(ts: float) -> str:
+    """float 타임스탬프를 ISO 문자열로 — datetime 객체 할당 없이 포맷한다."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(ts))
+
+
+# 폴링이 몰릴 때 같은 "현재 시각" 문자열을 재사용한다 (50ms 캐시).
+_now_iso_cache: tuple[float, str] = (0.0, "")
+
+
+def _cached_now_iso() -> str:
+    global _now_iso_cache
+    now = time.monotonic()
+    if now - _now_iso_cache[0] > 0.05:
+        _now_iso_cache = (now, datetime.now(timezone.utc).isoformat(timespec="seconds"))
+    return _now_iso_cache[1]
+
+
+@functools.lru_cache(maxsize=64)
+def _mask_secret(value: str) -> str:
+    value = value or ""
+    if not value:
+        return ""
+    if len(value) <= 4:
+        return "*" * len(value)
+    return f"{value[:2]}{'*' * (len(value) - 4)}{value[-2:]}"
+
+
+@functools.lru_cache(maxsize=64)
+def _split_csv(value: str | None) -> tuple[str, ...]:
+    if not value:
+        return ()
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+# 원격 노드 uid용 생성기. urandom 시딩 후에는 시스템 콜 없이 ID를 뽑는다.
+# 암호학적 난수가 아니므로 토큰/세션 값에는 쓰지 말 것 — 내부 리소스 ID 전용.
+_rand = random.Random(os.urandom(32))
+
+
+def _fast_uid() -> str:
+    return _rand.randbytes(16).hex()
+
+
+def _clean_str(value: Any) -> str:
+    """JSON에서 온 값을 공백 제거한 문자열로 정규화한다 (str이면 변환 생략)."""
+    if type(value) is str:
+        return value.strip()
+    if value is None:
+        return ""
+    return str(value).strip()
+
+
+def _coerce_remote_create(data: Dict[str, Any]) -> tuple[str, str, int, str]:
+    """원격 노드 생성 본문을 검증한다. 문제가 있으면 ValueError(메시지)."""
+    name = _clean_str(data.get("name"))
+    host = _clean_str(data.get("host"))
+    if not name or not host:
+        raise ValueError("'name'와 'host'를 입력하세요.")
+    port_value = data.get("port", 0)
+    if type(port_value) is int:
+        port = port_value
+    else:
+        try:
+            port = int(port_value) if port_value else 0
+        except (TypeError, ValueError):
+            raise ValueError("유효한 'port' 값을 입력하세요.") from None
+    if port <= 0 or port > 65535:
+        port = 9000
+    return name, host, port, _clean_str(data.get("notes"))
+
+
+async def _read_json(request: web.Request) -> Dict[str, Any] | None:
+    """본문을 orjson 경로로 해석한다. 실패하면 None (stdlib json 파서 회피)."""
+    raw = await request.read()
+    try:
+        data = json_loads(raw)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
 
 @dataclass
 class Client:
@@ -38,6 +170,10 @@ class Client:
     last_seen: float
     status: str = "online"
     metadata: NodeMetadata | None = None
+    # 브로드캐스트 프레임 조립에 쓰는 인코딩된 uid (접속 시 1회 계산).
+    uid_bytes: bytes = b""
+    # 노드 레코드를 마지막으로 DB에 쓴 시각 (last_seen 디바운스용).
+    last_persist: float = 0.0
 
 
 @dataclass
@@ -52,6 +188,67 @@ class RemoteNode:
     status: str
     last_seen: float | None = None
     notes: str = ""
+    # 직렬화 결과 캐시 — 필드가 바뀔 때 None으로 되돌린다.
+    payload_cache: dict[str, Any] | None = None
+
+
+# 프런트엔드 번들이 없을 때 내보내는 플레이스홀더 (기동 시 한 번만 인코딩).
+_PLACEHOLDER_HTML = """
+<!DOCTYPE html>
+<html lang="ko">
+  <head>
+    <meta charset="utf-8" />
+    <title>Codernetes Master Control</title>
+    <style>
+      body {
+        margin: 0;
+        padding: 3rem;
+        font-family: 'Noto Sans KR', 'Segoe UI', sans-serif;
+        background: #0f172a;
+        color: #e2e8f0;
+      }
+      main {
+        max-width: 640px;
+        margin: 0 auto;
+        background: #111c32;
+        padding: 2rem 2.5rem;
+        border-radius: 20px;
+        box-shadow: 0 30px 60px rgba(15, 23, 42, 0.35);
+      }
+      h1 {
+        margin-top: 0;
+        font-size: 1.75rem;
+      }
+      p {
+        line-height: 1.6;
+      }
+      code {
+        background: rgba(148, 163, 184, 0.15);
+        padding: 0.15rem 0.4rem;
+        border-radius: 6px;
+      }
+      a {
+        color: #93c5fd;
+      }
+    </style>
+  </head>
+  <body>
+    <main>
+      <h1>프런트엔드 번들이 준비되지 않았습니다</h1>
+      <p>
+        React 대시보드를 사용하려면 <code>frontend</code> 디렉터리에서
+        <code>npm install</code>, <code>npm run build</code> 명령을 실행한 뒤
+        마스터 서버를 다시 시작하세요.
+      </p>
+      <p>
+        개발 중이라면 <code>npm run dev</code> 를 실행하고 Vite 개발 서버
+        (기본 포트 5173)에 접속해 UI를 확인할 수 있습니다. 이때 API 요청은
+        프록시를 통해 현재 마스터(포트 8765)로 전달됩니다.
+      </p>
+    </main>
+  </body>
+</html>
+""".encode()
 
 
 class MasterServer:
@@ -72,21 +269,57 @@ class MasterServer:
         self._http_host = http_host or host
         self._http_port = http_port
         self._clients: Dict[ServerConnection, Client] = {}
+        # uid -> Client 역인덱스: 직접 전송/REST 경로의 선형 탐색을 없앤다.
+        self._clients_by_uid: Dict[str, Client] = {}
+        # 멤버십이 바뀔 때만 갱신되는 연결 스냅샷 — 브로드캐스트마다 dict 순회를 피한다.
+        self._client_conns: list[ServerConnection] = []
+        # /api/status 응답 캐시. 세대 번호가 그대로면 직렬화를 건너뛴다.
+        self._status_generation = 0
+        self._status_cache_bytes: bytes | None = None
+        self._status_cache_generation = -1
         self._server: Server | None = None
         self._health_interval = max(health_interval, 1.0)
         self._health_timeout = max(health_timeout, 1.0)
         self._health_task: asyncio.Task | None = None
         self._dispatch_task: asyncio.Task | None = None
-        self._dispatch_interval = 2.0
+        self._log_flush_task: asyncio.Task | None = None
+        # 폴링 대신 이벤트로 디스패처를 깨운다 (작업 생성/종료, 클라이언트 접속 시).
+        self._dispatch_wake = asyncio.Event()
+        # 인바운드 프레임 타입 -> 핸들러 상수 시간 디스패치 테이블.
+        self._msg_handlers: dict[str, Callable[[Client, dict[str, Any]], None]] = {
+            "job.status": self._handle_job_status_message,
+            "job.log": self._handle_job_log_message,
+            "job.log.batch": self._handle_job_log_batch_message,
+            "node.hello": self._handle_node_hello_message,
+            "command": self._schedule_command_message,
+        }
         self._storage = storage
         self._config = self._load_initial_config()
-        self._config_updated_at = datetime.utcnow()
-        self._remote_nodes: list[RemoteNode] = self._init_mock_remotes()
+        self._config_updated_at = datetime.now(timezone.utc)
+        # 디스패치마다 중첩 dict 조회를 하지 않도록 workdir 루트를 캐싱한다.
+        self._workdir_root = self._config.get("job", {}).get("workdir_root", "/tmp/codernetes-jobs")
+        # 설정 페이로드는 순수하게 _config/_config_updated_at의 함수이므로
+        # 쓰기 시에만 무효화되는 캐시로 관리한다.
+        self._config_payload_cache: dict[str, Any] | None = None
+        self._config_payload_bytes: bytes | None = None
+        # uid 키 dict: 조회/삭제가 O(1)이고 삭제 때 리스트 재구성이 없다.
+        self._remote_nodes: dict[str, RemoteNode] = self._init_mock_remotes()
+        # 원격 노드 변경 버전 — 목록 응답 바디 캐시와 ETag의 키로 쓴다.
+        self._remotes_version = 0
+        self._remotes_cache_bytes: bytes | None = None
+        self._remotes_cache_version = -1
         self._frontend_dist = (
             Path(__file__).resolve().parent.parent / "frontend" / "dist"
         )
+        # index.html은 기동 시 한 번만 읽어 메모리에서 서빙한다 (요청마다 stat/open 없음).
+        self._index_bytes: bytes | None = None
+        self._index_etag: str | None = None
+        index_path = self._frontend_dist / "index.html"
+        if index_path.exists():
+            self._index_bytes = index_path.read_bytes()
+            self._index_etag = hashlib.md5(self._index_bytes).hexdigest()
         self._web_app = web.Application()
-        self._api_handler = ApiHandler(self._storage)
+        self._api_handler = ApiHandler(self._storage, on_jobs_changed=self._dispatch_wake.set)
         self._web_app.add_routes(
             [
                 web.get("/", self._handle_index),
@@ -102,9 +335,24 @@ class MasterServer:
             ]
         )
         self._web_app.add_routes(self._api_handler.routes())
-        assets_dir = self._frontend_dist / "assets"
-        if assets_dir.exists():
-            self._web_app.router.add_static("/assets", assets_dir, show_index=False)
+        self._web_app.on_startup.append(self._api_handler.on_startup)
+        self._web_app.on_cleanup.append(self._api_handler.on_cleanup)
+        # 정적 자산도 기동 시 한 번 읽어 메모리에서 서빙한다. 이벤트 루프에서
+        # stat/open이 일어나지 않도록 add_static 대신 전용 핸들러를 쓴다.
+        self._assets_dir = self._frontend_dist / "assets"
+        self._asset_cache: dict[str, tuple[bytes, str, str]] = {}
+        if self._assets_dir.exists():
+            for path in self._assets_dir.rglob("*"):
+                if not path.is_file() or path.stat().st_size > _ASSET_CACHE_MAX_BYTES:
+                    continue
+                body = path.read_bytes()
+                content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+                self._asset_cache[str(path.relative_to(self._assets_dir))] = (
+                    body,
+                    content_type,
+                    hashlib.md5(body).hexdigest(),
+                )
+            self._web_app.router.add_get("/assets/{rel:.*}", self._handle_asset)
         # SPA fallback 라우트
         self._web_app.router.add_get("/{tail:.*}", self._handle_index)
         self._web_runner: web.AppRunner | None = None
@@ -118,10 +366,14 @@ class MasterServer:
             self._host,
             self._port,
             process_request=self._process_ws_request,
+            # keepalive ping은 라이브러리가 전담한다: 응답이 없으면 연결을 닫는다.
+            ping_interval=self._health_interval,
+            ping_timeout=self._health_timeout,
         )
         await self._start_http()
         self._start_health_monitor()
         self._start_dispatcher()
+        self._start_log_flusher()
 
     async def stop(self) -> None:
         """서버를 안전하게 종료한다."""
@@ -133,17 +385,19 @@ class MasterServer:
         await self._stop_http()
         await self._stop_health_monitor()
         await self._stop_dispatcher()
+        await self._stop_log_flusher()
 
     async def _cleanup_clients(self) -> None:
         """모든 클라이언트 연결을 닫는다."""
         if not self._clients:
             return
         LOGGER.info("Closing %d client connection(s)", len(self._clients))
-        await asyncio.gather(
-            *(client.connection.close(code=1001, reason="Server shutdown") for client in self._clients.values()),
-            return_exceptions=True,
+        await _bounded_gather(
+            client.connection.close(code=1001, reason="Server shutdown") for client in self._clients.values()
         )
         self._clients.clear()
+        self._clients_by_uid.clear()
+        self._client_conns.clear()
 
     async def _start_http(self) -> None:
         if self._web_runner is not None:
@@ -187,6 +441,34 @@ class MasterServer:
             await self._dispatch_task
         self._dispatch_task = None
 
+    def _start_log_flusher(self) -> None:
+        if self._log_flush_task is None:
+            self._log_flush_task = asyncio.create_task(self._log_flush_loop())
+
+    async def _stop_log_flusher(self) -> None:
+        if self._log_flush_task is None:
+            return
+        self._log_flush_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._log_flush_task
+        self._log_flush_task = None
+
+    async def _log_flush_loop(self) -> None:
+        """버퍼링된 작업 로그를 주기적으로 쓰기 스레드에서 비운다.
+
+        append 경로는 건수/나이 임계치로 스스로 플러시하므로, 이 루프는
+        트래픽이 끊긴 뒤 남은 꼬리 배치를 커밋 한 번으로 밀어내는 역할이다.
+        """
+        try:
+            while True:
+                await asyncio.sleep(_LOG_FLUSH_INTERVAL)
+                try:
+                    await self._storage.run_write(self._storage.flush_job_logs)
+                except Exception:  # noqa: BLE001
+                    LOGGER.exception("Log flusher: error while flushing buffered logs")
+        except asyncio.CancelledError:
+            LOGGER.debug("Log flusher stopped")
+
     async def _health_loop(self) -> None:
         try:
             while True:
@@ -198,7 +480,10 @@ class MasterServer:
     async def _dispatch_loop(self) -> None:
         try:
             while True:
-                await asyncio.sleep(self._dispatch_interval)
+                # 이벤트가 유실될 경우를 대비해 30초 안전망 타임아웃을 둔다.
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._dispatch_wake.wait(), timeout=30)
+                self._dispatch_wake.clear()
                 try:
                     await self._dispatch_jobs_once()
                 except Exception:  # noqa: BLE001
@@ -210,10 +495,23 @@ class MasterServer:
         if not self._clients:
             return
 
-        await asyncio.gather(
-            *(self._check_client_health(client) for client in list(self._clients.values())),
-            return_exceptions=True,
-        )
+        # 수동 ping 대신 연결 상태/정체 여부만 확인한다. 죽은 피어는
+        # serve()의 ping_timeout이 연결을 닫아 closed로 드러난다.
+        now = time.time()
+        stale_after = self._health_interval * 3 + self._health_timeout
+        for client in list(self._clients.values()):
+            self._check_client_health(client, now, stale_after)
+
+        # 디바운스로 미뤄둔 last_seen 전용 갱신을 한 트랜잭션으로 밀어 넣는다.
+        dirty: list[tuple[str, datetime]] = []
+        for client in self._clients.values():
+            if client.metadata is not None and client.last_seen > client.last_persist:
+                dirty.append((client.uid, client.metadata.last_seen))
+                client.last_persist = now
+        if dirty:
+            self._storage.touch_nodes(dirty)
+        # last_seen 표시가 헬스 주기만큼은 따라오도록 상태 캐시를 갱신한다.
+        self._status_generation += 1
 
     async def _dispatch_jobs_once(self) -> None:
         if not self._clients:
@@ -235,6 +533,7 @@ class MasterServer:
             [(job.job_id, job.status.value, job.target_node_id) for job in jobs],
         )
 
+        pairs: list[tuple[Client, Job]] = []
         for client in candidates:
             job = self._select_job_for_client(client, jobs)
             if job is None:
@@ -252,16 +551,38 @@ class MasterServer:
                 continue
 
             LOGGER.info("Dispatcher: assigning job %s to client %s", job.job_id, client.uid)
-            await self._send_job_assignment(client, job)
+            pairs.append((client, job))
+            jobs = [j for j in jobs if j.job_id != job.job_id]
+            if not jobs:
+                break
+
+        if not pairs:
+            return
+
+        # 전송은 병렬로 — 느린 피어 하나가 나머지 배정을 막지 않는다.
+        results = await asyncio.gather(
+            *(self._send_job_assignment(client, job) for client, job in pairs),
+            return_exceptions=True,
+        )
+        for (client, job), result in zip(pairs, results):
+            if isinstance(result, BaseException):
+                LOGGER.warning(
+                    "Dispatcher: failed to send job %s to %s: %s", job.job_id, client.uid, result
+                )
+                # 전송 실패분은 다시 큐로 되돌려 다음 깨어남에 재시도한다.
+                self._storage.update_job_status(job.job_id, JobStatus.QUEUED)
+                # _send_job_assignment가 전송 전에 busy로 바꿔 두므로,
+                # 그대로 두면 일시적 전송 오류만으로도 배정에서 계속 빠진다.
+                if client.status == "busy":
+                    client.status = "online"
+                    self._update_node_record(client, status="online")
+                continue
             self._storage.update_job_status(
                 job.job_id,
                 JobStatus.RUNNING,
                 result_summary="dispatched",
                 log_path=None,
             )
-            jobs = [j for j in jobs if j.job_id != job.job_id]
-            if not jobs:
-                break
 
     def _is_client_available(self, client: Client) -> bool:
         closed_attr = getattr(client.connection, "closed", None)
@@ -295,12 +616,12 @@ class MasterServer:
         return None
 
     async def _send_job_assignment(self, client: Client, job: Job) -> None:
-        workdir = f"{self._config.get('job', {}).get('workdir_root', '/tmp/codernetes-jobs')}/{job.job_id}"
+        workdir = f"{self._workdir_root}/{job.job_id}"
         message = {
             "type": "job.assign",
             "job_id": job.job_id,
             "prompt": job.prompt,
-            "repositories": [repo.__dict__ for repo in job.repositories],
+            "repositories": [repo.to_dict() for repo in job.repositories],
             "workdir": workdir,
             "metadata": job.metadata,
             "requested_tags": job.requested_tags,
@@ -308,43 +629,40 @@ class MasterServer:
         }
         LOGGER.info("Dispatching job %s to node %s", job.job_id, client.uid)
         client.status = "busy"
-        await client.connection.send(json.dumps(message))
+        await client.connection.send(json_dumps(message))
         self._update_node_record(client, status="busy")
 
-    async def _check_client_health(self, client: Client) -> None:
-        if client.connection.closed:
-            client.status = "disconnected"
-            self._update_node_record(client, status="offline")
+    def _check_client_health(self, client: Client, now: float, stale_after: float) -> None:
+        closed_attr = getattr(client.connection, "closed", None)
+        if isinstance(closed_attr, bool) and closed_attr:
+            if client.status != "disconnected":
+                client.status = "disconnected"
+                self._update_node_record(client, status="offline")
             return
 
-        ping_waiter = client.connection.ping()
-        try:
-            await asyncio.wait_for(ping_waiter, timeout=self._health_timeout)
-            client.last_seen = time.time()
-            if client.status != "online":
-                client.status = "online"
-            self._update_node_record(client, status="online")
-        except (asyncio.TimeoutError, Exception) as exc:  # noqa: BLE001
-            LOGGER.warning("Health check failed for %s: %s", client.uid, exc)
-            client.status = "unresponsive"
-            self._update_node_record(client, status="unresponsive")
+        # 연결이 열려 있다는 것 자체가 serve()의 keepalive ping/pong이 살아
+        # 있다는 증거다 (죽은 피어는 ping_timeout이 닫아 위의 closed 분기로
+        # 드러난다). 유휴 노드는 앱 프레임을 전혀 보내지 않으므로, 프로토콜
+        # keepalive를 생존 신호로 간주해 last_seen을 갱신한다 — 오래 조용한
+        # 노드를 unresponsive로 굳혀 배정에서 제외하면 영영 복구되지 않는다.
+        if now - client.last_seen > stale_after:
+            client.last_seen = now
+            if client.metadata is not None:
+                client.metadata.last_seen = datetime.now(timezone.utc)
 
     async def _handler(self, connection: ServerConnection) -> None:
-        client = Client(uid=str(uuid.uuid4()), connection=connection, last_seen=time.time())
+        uid = str(uuid.uuid4())
+        client = Client(uid=uid, connection=connection, last_seen=time.time(), uid_bytes=uid.encode())
         self._clients[connection] = client
+        self._clients_by_uid[client.uid] = client
+        self._client_conns.append(connection)
+        self._status_generation += 1
         LOGGER.info("Client %s connected", client.uid)
         self._register_node(client)
+        self._dispatch_wake.set()
 
         # 연결된 클라이언트에게 인사말을 전송
-        await connection.send(
-            json.dumps(
-                {
-                    "type": "welcome",
-                    "client_id": client.uid,
-                    "message": "Connected to Codernetes master",
-                }
-            )
-        )
+        await connection.send(_WELCOME_PREFIX + client.uid_bytes + _WELCOME_SUFFIX)
 
         try:
             async for raw_message in connection:
@@ -354,6 +672,9 @@ class MasterServer:
                 self._update_node_record(client, status="online")
                 if self._process_incoming_message(client, raw_message):
                     continue
+                if isinstance(raw_message, bytes):
+                    # JSON이 아닌 바이너리 프레임은 중계 전에 텍스트로 되돌린다.
+                    raw_message = raw_message.decode("utf-8", errors="replace")
                 await self._broadcast(raw_message, sender=client)
         except ConnectionClosed as exc:
             LOGGER.info("Client %s disconnected (%s)", client.uid, exc.code)
@@ -361,6 +682,10 @@ class MasterServer:
             client.status = "disconnected"
             self._update_node_record(client, status="offline")
             self._clients.pop(connection, None)
+            self._clients_by_uid.pop(client.uid, None)
+            with suppress(ValueError):
+                self._client_conns.remove(connection)
+            self._status_generation += 1
 
     async def _broadcast(self, raw_message: str, sender: Optional[Client]) -> None:
         """송신자를 제외한 모든 클라이언트에 메시지를 전달."""
@@ -368,12 +693,11 @@ class MasterServer:
             LOGGER.debug("No clients to broadcast message")
             return
 
-        payload = self._build_message_payload(raw_message, sender)
-        payload_json = json.dumps(payload)
+        payload_json = self._render_message_frame(raw_message, sender)
         recipient_count = len(self._clients) if sender is None else len(self._clients) - 1
         LOGGER.debug(
             "Broadcasting message from %s to %d client(s)",
-            payload["from"],
+            sender.uid if sender is not None else "master",
             max(recipient_count, 0),
         )
         if sender is None:
@@ -381,33 +705,34 @@ class MasterServer:
             for client in self._clients.values():
                 client.last_seen = now
                 client.status = "online"
-        await asyncio.gather(
-            *(
-                client.connection.send(payload_json)
-                for conn, client in self._clients.items()
-                if sender is None or conn is not sender.connection
-            ),
-            return_exceptions=True,
-        )
+        # broadcast()는 태스크를 만들지 않고 각 연결의 쓰기 버퍼에 프레임을 바로 싣는다.
+        # 페이로드 직렬화는 위에서 한 번만 — 수신자 수만큼 재인코딩하지 않는다.
+        if sender is None:
+            recipients = self._client_conns
+        else:
+            recipients = [conn for conn in self._client_conns if conn is not sender.connection]
+        if len(recipients) <= _BROADCAST_BATCH:
+            if recipients:
+                broadcast(recipients, payload_json)
+            return
+        # 대규모 fleet는 배치로 끊어 보내 한 틱을 독점하지 않는다.
+        for start in range(0, len(recipients), _BROADCAST_BATCH):
+            broadcast(recipients[start:start + _BROADCAST_BATCH], payload_json)
+            await asyncio.sleep(0)
 
-    def _build_message_payload(self, raw_message: str, sender: Optional[Client]) -> dict:
-        return {
-            "type": "message",
-            "from": sender.uid if sender is not None else "master",
-            "payload": raw_message,
-        }
+    def _render_message_frame(self, raw_message: Any, sender: Optional[Client]) -> bytes:
+        """중계 프레임을 dict 할당 없이 바이트 조각으로 조립한다."""
+        sender_bytes = sender.uid_bytes if sender is not None else _MASTER_UID
+        return _MSG_PREFIX + sender_bytes + _MSG_PAYLOAD_SEP + json_dumps(raw_message) + _MSG_SUFFIX
 
     def _find_client(self, client_id: str) -> Optional[Client]:
-        for client in self._clients.values():
-            if client.uid == client_id:
-                return client
-        return None
+        return self._clients_by_uid.get(client_id)
 
     async def _send_to_client(self, client_id: str, raw_message: str) -> bool:
         client = self._find_client(client_id)
         if client is None:
             return False
-        payload_json = json.dumps(self._build_message_payload(raw_message, sender=None))
+        payload_json = self._render_message_frame(raw_message, sender=None)
         await client.connection.send(payload_json)
         client.last_seen = time.time()
         if client.status != "online":
@@ -422,7 +747,7 @@ class MasterServer:
             display_name=None,
             tags=[],
             capabilities={},
-            last_seen=datetime.utcnow(),
+            last_seen=datetime.now(timezone.utc),
             status="online",
         )
         client.metadata = metadata
@@ -438,7 +763,7 @@ class MasterServer:
         capabilities: dict[str, str] | None = None,
     ) -> None:
         metadata = client.metadata
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         if metadata is None:
             metadata = NodeMetadata(
                 node_id=client.uid,
@@ -449,43 +774,78 @@ class MasterServer:
                 status=status or "online",
             )
         else:
-            updates: dict[str, Any] = {"last_seen": now}
+            # 메시지마다 호출되는 경로라 새 인스턴스를 만들지 않고 제자리에서 갱신한다.
+            changed = (
+                (status is not None and status != metadata.status)
+                or display_name is not None
+                or tags is not None
+                or capabilities is not None
+            )
+            metadata.last_seen = now
             if status is not None:
-                updates["status"] = status
+                metadata.status = status
             if display_name is not None:
-                updates["display_name"] = display_name
+                metadata.display_name = display_name
             if tags is not None:
-                updates["tags"] = tags
+                metadata.tags = tags
             if capabilities is not None:
-                updates["capabilities"] = capabilities
-            metadata = replace(metadata, **updates)
+                metadata.capabilities = capabilities
+            if changed:
+                self._status_generation += 1
+            elif time.time() - client.last_persist < _NODE_PERSIST_DEBOUNCE:
+                # last_seen만 바뀐 경우는 헬스 루프의 touch_nodes가 모아서 기록한다.
+                return
 
         client.metadata = metadata
         self._storage.upsert_node(metadata)
-
-    def _process_incoming_message(self, client: Client, raw_message: str) -> bool:
+        client.last_persist = time.time()
+
+    def _process_incoming_message(self, client: Client, raw_message: str | bytes) -> bool:
+        # 길이 프리픽스 바이너리 프레임(로그 배치)은 JSON 파서를 거치지 않는다.
+        # JSON 텍스트/바이트 프레임은 항상 '{'로 시작하므로 첫 바이트로 구분한다.
+        if isinstance(raw_message, (bytes, bytearray)) and not raw_message.startswith(b"{"):
+            return self._process_binary_log_batch(client, raw_message)
+        # orjson은 bytes 프레임을 디코드 없이 바로 파싱한다.
         try:
-            payload = json.loads(raw_message)
-        except json.JSONDecodeError:
+            payload = json_loads(raw_message)
+        except ValueError:
             return False
 
         if not isinstance(payload, dict):
             return False
 
-        message_type = payload.get("type")
-        if message_type == "job.status":
-            self._handle_job_status_message(client, payload)
-            return True
-        if message_type == "job.log":
-            self._handle_job_log_message(client, payload)
-            return True
-        if message_type == "node.hello":
-            self._handle_node_hello_message(client, payload)
-            return True
-        if message_type == "command":
-            asyncio.create_task(self._handle_command_message(client, payload))
-            return True
-        return False
+        handler = self._msg_handlers.get(payload.get("type"))
+        if handler is None:
+            return False
+        handler(client, payload)
+        return True
+
+    def _process_binary_log_batch(self, client: Client, raw: bytes) -> bool:
+        """[4바이트 헤더 길이][JSON 헤더][본문] 형식의 로그 배치 프레임을 해석한다."""
+        if len(raw) < 4:
+            return False
+        header_len = int.from_bytes(raw[:4], "big")
+        if len(raw) < 4 + header_len:
+            return False
+        try:
+            header = json_loads(raw[4:4 + header_len])
+        except ValueError:
+            return False
+        if not isinstance(header, dict) or header.get("type") != "job.log.batch":
+            return False
+        job_ids = header.get("job_ids") or []
+        levels = header.get("levels") or []
+        lens = header.get("lens") or []
+        body = memoryview(raw)[4 + header_len:]
+        offset = 0
+        for job_id, level, length in zip(job_ids, levels, lens):
+            message = bytes(body[offset:offset + length]).decode("utf-8", errors="replace")
+            offset += length
+            self._storage.append_job_log(str(job_id), str(level).lower(), message)
+        return True
+
+    def _schedule_command_message(self, client: Client, payload: dict[str, Any]) -> None:
+        asyncio.create_task(self._handle_command_message(client, payload))
 
     def _handle_job_status_message(self, client: Client, payload: dict[str, Any]) -> None:
         job_id = payload.get("job_id")
@@ -518,6 +878,10 @@ class MasterServer:
             client.status = node_status
             self._update_node_record(client, status=node_status)
 
+        if status in {JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED}:
+            # 노드가 비었으니 대기 중인 작업이 있으면 바로 배정한다.
+            self._dispatch_wake.set()
+
     def _handle_job_log_message(self, client: Client, payload: dict[str, Any]) -> None:
         job_id = payload.get("job_id", "unknown")
         level = str(payload.get("level", "info")).lower()
@@ -531,6 +895,22 @@ class MasterServer:
         else:
             LOGGER.info(*log_message)
 
+    def _handle_job_log_batch_message(self, client: Client, payload: dict[str, Any]) -> None:
+        # 노드가 줄 단위 프레임 대신 모아 보낸 로그 묶음. 스토리지 버퍼가
+        # executemany로 다시 묶으므로 여기서는 그대로 흘려보내면 된다.
+        entries = payload.get("entries")
+        if not isinstance(entries, list):
+            LOGGER.warning("Invalid job.log.batch payload from %s", client.uid)
+            return
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            self._storage.append_job_log(
+                entry.get("job_id", "unknown"),
+                str(entry.get("level", "info")).lower(),
+                entry.get("message", ""),
+            )
+
     async def _handle_command_message(self, client: Client, payload: dict[str, Any]) -> None:
         source = payload.get("source") or {}
         command_info = payload.get("command") or {}
@@ -580,7 +960,7 @@ class MasterServer:
         job = Job(
             job_id=str(uuid.uuid4()),
             prompt=prompt,
-            created_at=datetime.utcnow(),
+            created_at=datetime.now(timezone.utc),
             status=JobStatus.PENDING,
             target_node_id=target_node_id,
             requested_tags=requested_tags,
@@ -604,15 +984,14 @@ class MasterServer:
             ack_message = f"작업 {job.job_id} 생성 ({job.status.value})"
             await self._send_platform_message(client, ack_target, ack_message)
 
-        asyncio.create_task(self._dispatch_jobs_once())
+        self._dispatch_wake.set()
 
     async def _send_platform_message(self, client: Client, target: dict[str, Any] | None, text: str) -> None:
         if not target:
             return
         payload = {"target": target, "text": text}
-        message = self._build_message_payload(payload, sender=None)
         try:
-            await client.connection.send(json.dumps(message))
+            await client.connection.send(self._render_message_frame(payload, sender=None))
         except Exception as exc:  # noqa: BLE001
             LOGGER.warning("Failed to send platform message: %s", exc)
 
@@ -687,14 +1066,14 @@ class MasterServer:
         }
         return config
 
-    def _init_mock_remotes(self) -> list[RemoteNode]:
+    def _init_mock_remotes(self) -> dict[str, RemoteNode]:
         tags = self._config.get("bridge", {}).get("remote_default_tags", [])
         if isinstance(tags, str):
             tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
         now = time.time()
-        return [
+        remotes = [
             RemoteNode(
-                uid=str(uuid.uuid4()),
+                uid=_fast_uid(),
                 name="staging-codernetes",
                 host="10.0.10.4",
                 port=9000,
@@ -704,7 +1083,7 @@ class MasterServer:
                 notes="최근 빌드 이후 정상",
             ),
             RemoteNode(
-                uid=str(uuid.uuid4()),
+                uid=_fast_uid(),
                 name="prod-runner-1",
                 host="10.0.10.21",
                 port=9000,
@@ -714,28 +1093,18 @@ class MasterServer:
                 notes="GPU 점검 예정",
             ),
         ]
-
-    def _mask_secret(self, value: str) -> str:
-        value = value or ""
-        if not value:
-            return ""
-        if len(value) <= 4:
-            return "*" * len(value)
-        return f"{value[:2]}{'*' * (len(value) - 4)}{value[-2:]}"
-
-    def _split_csv(self, value: str | None) -> list[str]:
-        if not value:
-            return []
-        return [item.strip() for item in value.split(",") if item.strip()]
+        return {remote.uid: remote for remote in remotes}
 
     def _normalize_tags(self, value: Any) -> list[str]:
         if isinstance(value, list):
             return [str(item).strip() for item in value if str(item).strip()]
         if isinstance(value, str):
-            return self._split_csv(value)
+            return list(_split_csv(value))
         return []
 
     def _config_payload(self) -> dict[str, Any]:
+        if self._config_payload_cache is not None:
+            return self._config_payload_cache
         master_cfg = dict(self._config.get("master", {}))
         bridge_cfg = dict(self._config.get("bridge", {}))
         slack_cfg = dict(self._config.get("slack", {}))
@@ -743,7 +1112,7 @@ class MasterServer:
 
         bridge_tags = bridge_cfg.get("remote_default_tags", [])
         if isinstance(bridge_tags, str):
-            bridge_tags_list = self._split_csv(bridge_tags)
+            bridge_tags_list = list(_split_csv(bridge_tags))
         else:
             bridge_tags_list = list(bridge_tags)
         bridge_cfg["remote_default_tags"] = bridge_tags_list
@@ -751,14 +1120,14 @@ class MasterServer:
 
         slack_cfg.setdefault("bot_token", "")
         slack_cfg.setdefault("default_channel", "")
-        slack_cfg["bot_token_masked"] = self._mask_secret(slack_cfg["bot_token"])
+        slack_cfg["bot_token_masked"] = _mask_secret(slack_cfg["bot_token"])
         slack_cfg["has_token"] = bool(slack_cfg["bot_token"])
 
         telegram_cfg.setdefault("bot_token", "")
         telegram_cfg.setdefault("parse_mode", "")
         telegram_cfg.setdefault("allowed_chats", "")
-        telegram_cfg["bot_token_masked"] = self._mask_secret(telegram_cfg["bot_token"])
-        telegram_cfg["allowed_chats_list"] = self._split_csv(telegram_cfg["allowed_chats"])
+        telegram_cfg["bot_token_masked"] = _mask_secret(telegram_cfg["bot_token"])
+        telegram_cfg["allowed_chats_list"] = list(_split_csv(telegram_cfg["allowed_chats"]))
 
         job_cfg = dict(self._config.get("job", {}))
         job_cfg.setdefault("workdir_root", "/tmp/codernetes-jobs")
@@ -772,10 +1141,15 @@ class MasterServer:
             "notes": self._config.get("notes", ""),
             "updated_at": self._config_updated_at.isoformat(timespec="seconds"),
         }
+        self._config_payload_cache = payload
+        # GET /api/config 응답 바디까지 미리 직렬화해 둔다.
+        self._config_payload_bytes = json_dumps({"config": payload})
         return payload
 
     def _remote_to_payload(self, remote: RemoteNode) -> dict[str, Any]:
-        return {
+        if remote.payload_cache is not None:
+            return remote.payload_cache
+        remote.payload_cache = {
             "id": remote.uid,
             "name": remote.name,
             "host": remote.host,
@@ -783,88 +1157,58 @@ class MasterServer:
             "address": f"{remote.host}:{remote.port}",
             "tags": remote.tags,
             "status": remote.status,
-            "last_seen": (
-                datetime.fromtimestamp(remote.last_seen).isoformat(timespec="seconds")
-                if remote.last_seen
-                else None
-            ),
+            "last_seen": _format_ts(remote.last_seen) if remote.last_seen else None,
             "notes": remote.notes,
         }
+        return remote.payload_cache
 
     def _find_remote(self, remote_id: str) -> Optional[RemoteNode]:
-        for remote in self._remote_nodes:
-            if remote.uid == remote_id:
-                return remote
-        return None
+        return self._remote_nodes.get(remote_id)
 
 
     async def _handle_index(self, request: web.Request) -> web.Response:
         if request.path.startswith("/api/"):
             raise web.HTTPNotFound()
 
-        index_path = self._frontend_dist / "index.html"
-        if index_path.exists():
-            return web.FileResponse(index_path)
+        if self._index_bytes is not None:
+            if request.headers.get("If-None-Match") == self._index_etag:
+                return web.Response(status=304)
+            return web.Response(
+                body=self._index_bytes,
+                content_type="text/html",
+                headers={"ETag": self._index_etag or "", "Cache-Control": "no-cache"},
+            )
 
-        placeholder = """
-<!DOCTYPE html>
-<html lang="ko">
-  <head>
-    <meta charset="utf-8" />
-    <title>Codernetes Master Control</title>
-    <style>
-      body {
-        margin: 0;
-        padding: 3rem;
-        font-family: 'Noto Sans KR', 'Segoe UI', sans-serif;
-        background: #0f172a;
-        color: #e2e8f0;
-      }
-      main {
-        max-width: 640px;
-        margin: 0 auto;
-        background: #111c32;
-        padding: 2rem 2.5rem;
-        border-radius: 20px;
-        box-shadow: 0 30px 60px rgba(15, 23, 42, 0.35);
-      }
-      h1 {
-        margin-top: 0;
-        font-size: 1.75rem;
-      }
-      p {
-        line-height: 1.6;
-      }
-      code {
-        background: rgba(148, 163, 184, 0.15);
-        padding: 0.15rem 0.4rem;
-        border-radius: 6px;
-      }
-      a {
-        color: #93c5fd;
-      }
-    </style>
-  </head>
-  <body>
-    <main>
-      <h1>프런트엔드 번들이 준비되지 않았습니다</h1>
-      <p>
-        React 대시보드를 사용하려면 <code>frontend</code> 디렉터리에서
-        <code>npm install</code>, <code>npm run build</code> 명령을 실행한 뒤
-        마스터 서버를 다시 시작하세요.
-      </p>
-      <p>
-        개발 중이라면 <code>npm run dev</code> 를 실행하고 Vite 개발 서버
-        (기본 포트 5173)에 접속해 UI를 확인할 수 있습니다. 이때 API 요청은
-        프록시를 통해 현재 마스터(포트 8765)로 전달됩니다.
-      </p>
-    </main>
-  </body>
-</html>
-"""
-        return web.Response(text=placeholder, content_type="text/html")
+        return web.Response(body=_PLACEHOLDER_HTML, content_type="text/html")
+
+
+    async def _handle_asset(self, request: web.Request) -> web.StreamResponse:
+        rel = request.match_info.get("rel", "")
+        cached = self._asset_cache.get(rel)
+        if cached is None:
+            # 캐시 한도를 넘는 대용량 파일은 파일 시스템에서 직접 서빙한다.
+            path = (self._assets_dir / rel).resolve()
+            if not str(path).startswith(str(self._assets_dir)):
+                raise web.HTTPNotFound()
+            loop = asyncio.get_running_loop()
+            if not await loop.run_in_executor(None, path.is_file):
+                raise web.HTTPNotFound()
+            return web.FileResponse(path)
+
+        body, content_type, etag = cached
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304)
+        return web.Response(
+            body=body,
+            content_type=content_type,
+            # Vite 번들은 파일명에 해시가 붙으므로 공격적으로 캐싱해도 안전하다.
+            headers={"ETag": etag, "Cache-Control": "public, max-age=31536000, immutable"},
+        )
 
     async def _handle_status(self, _: web.Request) -> web.Response:
+        if self._status_cache_bytes is not None and self._status_cache_generation == self._status_generation:
+            return web.Response(body=self._status_cache_bytes, content_type="application/json")
+
         payload = {
             "status": "ok",
             "connected_clients": len(self._clients),
@@ -872,30 +1216,34 @@ class MasterServer:
                 {
                     "id": client.uid,
                     "status": client.status,
-                    "last_seen": datetime.fromtimestamp(client.last_seen).isoformat(timespec="seconds"),
+                    "last_seen": _format_ts(client.last_seen),
                 }
                 for client in self._clients.values()
             ],
         }
-        return web.json_response(payload)
+        body = json_dumps(payload)
+        self._status_cache_bytes = body
+        self._status_cache_generation = self._status_generation
+        return web.Response(body=body, content_type="application/json")
 
     async def _handle_config_get(self, _: web.Request) -> web.Response:
-        return web.json_response({"config": self._config_payload()})
+        if self._config_payload_bytes is None:
+            self._config_payload()
+        return web.Response(body=self._config_payload_bytes, content_type="application/json")
 
     async def _handle_config_update(self, request: web.Request) -> web.Response:
-        try:
-            data = await request.json()
-        except Exception:  # noqa: BLE001
-            return web.json_response({"error": "JSON body required"}, status=400)
-
-        if not isinstance(data, dict):
-            return web.json_response({"error": "JSON object expected"}, status=400)
+        data = await _read_json(request)
+        if data is None:
+            return json_response({"error": "JSON body required"}, status=400)
 
         self._apply_config_update(data)
-        self._config_updated_at = datetime.utcnow()
-        return web.json_response({"config": self._config_payload(), "status": "ok"})
+        self._config_updated_at = datetime.now(timezone.utc)
+        return json_response({"config": self._config_payload(), "status": "ok"})
 
     def _apply_config_update(self, data: dict[str, Any]) -> None:
+        # NOTE: 현재 설정은 메모리에만 유지된다. 디스크 영속화를 붙일 때는
+        # 이벤트 루프를 막지 않도록 asyncio.to_thread로 쓰고, UI의 연타 저장을
+        # loop.call_later(0.5, ...)로 디바운스해 마지막 갱신만 기록할 것.
         master_cfg = data.get("master")
         if isinstance(master_cfg, dict):
             target = self._config.setdefault("master", {})
@@ -945,41 +1293,44 @@ class MasterServer:
         if "notes" in data:
             self._config["notes"] = str(data["notes"]).strip()
 
-    async def _handle_remotes_get(self, _: web.Request) -> web.Response:
-        remotes_payload = [self._remote_to_payload(remote) for remote in self._remote_nodes]
-        return web.json_response(
-            {
-                "remotes": remotes_payload,
-                "count": len(remotes_payload),
-                "generated_at": datetime.utcnow().isoformat(timespec="seconds"),
-            }
+        self._config_payload_cache = None
+        self._config_payload_bytes = None
+        self._workdir_root = self._config.get("job", {}).get("workdir_root", "/tmp/codernetes-jobs")
+
+    async def _handle_remotes_get(self, request: web.Request) -> web.Response:
+        # 내용이 안 바뀐 폴링은 헤더 비교만으로 304를 돌려준다.
+        etag = f'W/"{_REMOTES_ETAG_EPOCH}-{self._remotes_version}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304)
+        if self._remotes_cache_bytes is None or self._remotes_cache_version != self._remotes_version:
+            remotes_payload = [self._remote_to_payload(remote) for remote in self._remote_nodes.values()]
+            self._remotes_cache_bytes = json_dumps(
+                {
+                    "remotes": remotes_payload,
+                    "count": len(remotes_payload),
+                    "generated_at": _cached_now_iso(),
+                }
+            )
+            self._remotes_cache_version = self._remotes_version
+        return web.Response(
+            body=self._remotes_cache_bytes,
+            content_type="application/json",
+            headers={"ETag": etag, "Cache-Control": "no-cache"},
         )
 
     async def _handle_remotes_create(self, request: web.Request) -> web.Response:
-        try:
-            data = await request.json()
-        except Exception:  # noqa: BLE001
-            return web.json_response({"error": "JSON body required"}, status=400)
-        if not isinstance(data, dict):
-            return web.json_response({"error": "JSON object expected"}, status=400)
-
-        name = str(data.get("name", "")).strip()
-        host = str(data.get("host", "")).strip()
-        port_value = data.get("port", 0)
-        notes = str(data.get("notes", "")).strip()
-        tags = self._normalize_tags(data.get("tags"))
+        data = await _read_json(request)
+        if data is None:
+            return json_response({"error": "JSON body required"}, status=400)
 
-        if not name or not host:
-            return web.json_response({"error": "'name'와 'host'를 입력하세요."}, status=400)
         try:
-            port = int(port_value) if port_value else 0
-        except (TypeError, ValueError):
-            return web.json_response({"error": "유효한 'port' 값을 입력하세요."}, status=400)
-        if port <= 0 or port > 65535:
-            port = 9000
+            name, host, port, notes = _coerce_remote_create(data)
+        except ValueError as exc:
+            return json_response({"error": str(exc)}, status=400)
+        tags = self._normalize_tags(data.get("tags"))
 
         remote = RemoteNode(
-            uid=str(uuid.uuid4()),
+            uid=_fast_uid(),
             name=name,
             host=host,
             port=port,
@@ -988,59 +1339,54 @@ class MasterServer:
             last_seen=time.time(),
             notes=notes,
         )
-        self._remote_nodes.append(remote)
+        self._remote_nodes[remote.uid] = remote
+        self._remotes_version += 1
         payload = self._remote_to_payload(remote)
-        return web.json_response({"remote": payload, "status": "ok"}, status=201)
+        return json_response({"remote": payload, "status": "ok"}, status=201)
 
     async def _handle_remote_delete(self, request: web.Request) -> web.Response:
         remote_id = request.match_info.get("remote_id", "")
         remote = self._find_remote(remote_id)
         if remote is None:
-            return web.json_response({"error": "존재하지 않는 원격 노드입니다."}, status=404)
-        self._remote_nodes = [node for node in self._remote_nodes if node.uid != remote_id]
-        return web.json_response({"status": "ok"})
+            return json_response({"error": "존재하지 않는 원격 노드입니다."}, status=404)
+        self._remote_nodes.pop(remote_id, None)
+        self._remotes_version += 1
+        return json_response({"status": "ok"})
 
     async def _handle_remote_action(self, request: web.Request) -> web.Response:
         remote_id = request.match_info.get("remote_id", "")
         remote = self._find_remote(remote_id)
         if remote is None:
-            return web.json_response({"error": "존재하지 않는 원격 노드입니다."}, status=404)
-        try:
-            data = await request.json()
-        except Exception:  # noqa: BLE001
-            return web.json_response({"error": "JSON body required"}, status=400)
+            return json_response({"error": "존재하지 않는 원격 노드입니다."}, status=404)
+        data = await _read_json(request)
+        if data is None:
+            return json_response({"error": "JSON body required"}, status=400)
         action = str(data.get("action", "")).strip().lower()
 
-        now = time.time()
-        if action == "mark_online":
-            remote.status = "online"
-            remote.last_seen = now
-        elif action == "mark_offline":
-            remote.status = "offline"
-        elif action == "mark_maintenance":
-            remote.status = "maintenance"
-        elif action == "mark_busy":
-            remote.status = "busy"
-            remote.last_seen = now
-        elif action == "touch":
-            remote.last_seen = now
-        else:
-            return web.json_response({"error": "지원하지 않는 action입니다."}, status=400)
+        entry = _REMOTE_ACTIONS.get(action)
+        if entry is None:
+            return json_response({"error": "지원하지 않는 action입니다."}, status=400)
+        status, touch = entry
+        if status is not None:
+            remote.status = status
+        if touch:
+            remote.last_seen = time.time()
 
-        return web.json_response({"remote": self._remote_to_payload(remote), "status": "ok"})
+        remote.payload_cache = None
+        self._remotes_version += 1
+        return json_response({"remote": self._remote_to_payload(remote), "status": "ok"})
 
     async def _handle_broadcast(self, request: web.Request) -> web.Response:
-        try:
-            data = await request.json()
-        except Exception:  # JSONDecodeError 포함
-            return web.json_response({"error": "JSON body required"}, status=400)
+        data = await _read_json(request)
+        if data is None:
+            return json_response({"error": "JSON body required"}, status=400)
 
         message = str(data.get("message", "")).strip()
         if not message:
-            return web.json_response({"error": "'message' 필드를 입력하세요."}, status=400)
+            return json_response({"error": "'message' 필드를 입력하세요."}, status=400)
 
         await self._broadcast(message, sender=None)
-        return web.json_response(
+        return json_response(
             {
                 "status": "ok",
                 "broadcasted": message,
@@ -1049,24 +1395,23 @@ class MasterServer:
         )
 
     async def _handle_send(self, request: web.Request) -> web.Response:
-        try:
-            data = await request.json()
-        except Exception:
-            return web.json_response({"error": "JSON body required"}, status=400)
+        data = await _read_json(request)
+        if data is None:
+            return json_response({"error": "JSON body required"}, status=400)
 
         target_id = str(data.get("client_id", "")).strip()
         message = str(data.get("message", "")).strip()
 
         if not target_id:
-            return web.json_response({"error": "'client_id' 필드를 입력하세요."}, status=400)
+            return json_response({"error": "'client_id' 필드를 입력하세요."}, status=400)
         if not message:
-            return web.json_response({"error": "'message' 필드를 입력하세요."}, status=400)
+            return json_response({"error": "'message' 필드를 입력하세요."}, status=400)
 
         success = await self._send_to_client(target_id, message)
         if not success:
-            return web.json_response({"error": "존재하지 않는 클라이언트입니다."}, status=404)
+            return json_response({"error": "존재하지 않는 클라이언트입니다."}, status=404)
 
-        return web.json_response(
+        return json_response(
             {
                 "status": "ok",
                 "client_id": target_id,
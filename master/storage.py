@@ -2,13 +2,113 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
+import os
+import queue
 import sqlite3
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Iterator, Sequence
 
 from .models import Job, JobStatus, NodeMetadata, RepositorySpec
+from .serialization import json_dumps, json_loads
+
+
+# 로그 버퍼 플러시 조건: 행 수 또는 첫 행 이후 경과 시간.
+_LOG_FLUSH_ROWS = 200
+_LOG_FLUSH_AGE = 0.05
+
+# 컬럼 집합은 고정이므로 upsert SQL은 모듈 로드 시 한 번만 조립한다.
+_JOB_COLUMNS = (
+    "job_id",
+    "prompt",
+    "status",
+    "target_node_id",
+    "requested_tags",
+    "repositories",
+    "metadata",
+    "log_path",
+    "result_summary",
+    "error_message",
+    "created_at",
+    "finished_at",
+)
+_UPSERT_JOB_SQL = (
+    f"INSERT INTO jobs ({', '.join(_JOB_COLUMNS)}) "
+    f"VALUES ({', '.join(':' + column for column in _JOB_COLUMNS)}) "
+    "ON CONFLICT(job_id) DO UPDATE SET "
+    + ", ".join(f"{column}=excluded.{column}" for column in _JOB_COLUMNS if column != "job_id")
+)
+
+# UPDATE ... RETURNING은 SQLite 3.35부터 지원된다.
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_DEQUEUE_JOB_SQL = """
+UPDATE jobs
+SET status = :running, target_node_id = COALESCE(:node_id, target_node_id)
+WHERE job_id = (
+    SELECT job_id FROM jobs WHERE status = :queued ORDER BY created_at ASC LIMIT 1
+)
+RETURNING *
+"""
+
+_NODE_COLUMNS = ("node_id", "display_name", "tags", "capabilities", "status", "last_seen")
+_UPSERT_NODE_SQL = (
+    f"INSERT INTO nodes ({', '.join(_NODE_COLUMNS)}) "
+    f"VALUES ({', '.join(':' + column for column in _NODE_COLUMNS)}) "
+    "ON CONFLICT(node_id) DO UPDATE SET "
+    + ", ".join(f"{column}=excluded.{column}" for column in _NODE_COLUMNS if column != "node_id")
+)
+
+
+def _to_epoch_us(value: datetime | None) -> int | None:
+    """작업 타임스탬프는 epoch 마이크로초 정수로 저장한다 (fromisoformat보다 싼 복원)."""
+    return int(value.timestamp() * 1_000_000) if value is not None else None
+
+
+def _from_db_datetime(value: object) -> datetime | None:
+    """epoch 정수와 (구버전 DB의) ISO 문자열을 모두 허용하는 복원 경로."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value / 1_000_000, tz=timezone.utc)
+    # TEXT 친화성 컬럼은 epoch 정수 바인딩도 숫자 문자열로 강제하므로
+    # 전부 숫자인 문자열은 epoch 마이크로초로 취급한다.
+    if value.isdigit():
+        return datetime.fromtimestamp(int(value) / 1_000_000, tz=timezone.utc)
+    return datetime.fromisoformat(value)
+
+
+def _format_db_datetime(value: object) -> str | None:
+    """목록 페이로드용 — DB 값이 어느 형식이든 ISO 문자열로 돌려준다."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        if not value.isdigit():
+            return value
+        value = int(value)
+    return datetime.fromtimestamp(value / 1_000_000, tz=timezone.utc).isoformat()
+
+
+def _coerce_epoch_us(value: object) -> int | None:
+    """마이그레이션용 — 과거 형식(ISO/숫자 문자열)을 epoch 마이크로초 정수로 바꾼다."""
+    if value is None or isinstance(value, int):
+        return value
+    text = str(value)
+    if text.isdigit():
+        return int(text)
+    return _to_epoch_us(datetime.fromisoformat(text))
+
+
+@functools.lru_cache(maxsize=256)
+def _decode_repositories(raw: str) -> tuple[RepositorySpec, ...]:
+    """같은 레포 목록을 쓰는 작업이 많으므로 원본 JSON 텍스트를 키로 캐싱한다."""
+    return tuple(RepositorySpec(**repo) for repo in json_loads(raw) or [])
 
 _DB_SCHEMA = """
 CREATE TABLE IF NOT EXISTS jobs (
@@ -16,21 +116,21 @@ CREATE TABLE IF NOT EXISTS jobs (
     prompt TEXT NOT NULL,
     status TEXT NOT NULL,
     target_node_id TEXT,
-    requested_tags TEXT,
-    repositories TEXT,
-    metadata TEXT,
+    requested_tags BLOB,
+    repositories BLOB,
+    metadata BLOB,
     log_path TEXT,
     result_summary TEXT,
     error_message TEXT,
-    created_at TEXT NOT NULL,
-    finished_at TEXT
+    created_at INTEGER NOT NULL,
+    finished_at INTEGER
 );
 
 CREATE TABLE IF NOT EXISTS nodes (
     node_id TEXT PRIMARY KEY,
     display_name TEXT,
-    tags TEXT,
-    capabilities TEXT,
+    tags BLOB,
+    capabilities BLOB,
     status TEXT NOT NULL,
     last_seen TEXT NOT NULL
 );
@@ -38,7 +138,7 @@ CREATE TABLE IF NOT EXISTS nodes (
 CREATE TABLE IF NOT EXISTS job_logs (
     job_id TEXT NOT NULL,
     seq INTEGER NOT NULL,
-    timestamp TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
     level TEXT NOT NULL,
     message TEXT NOT NULL,
     PRIMARY KEY (job_id, seq)
@@ -50,9 +150,13 @@ CREATE TABLE IF NOT EXISTS user_tokens (
     access_token TEXT NOT NULL,
     refresh_token TEXT,
     expires_at TEXT,
-    metadata TEXT,
+    metadata BLOB,
     PRIMARY KEY (user_id, provider)
 );
+
+-- 상태 필터 + 생성 시각 정렬을 인덱스로 처리한다.
+-- job_logs의 after_seq 페이지네이션은 (job_id, seq) PK 인덱스가 이미 감당한다.
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs (status, created_at DESC);
 """
 
 
@@ -62,70 +166,246 @@ CREATE TABLE IF NOT EXISTS user_tokens (
 class Storage:
     def __init__(self, db_path: Path) -> None:
         self._db_path = db_path
-        self._conn = sqlite3.connect(db_path)
+        # check_same_thread=False: 쓰기 실행자 스레드에서도 같은 연결을 쓴다.
+        # 이벤트 루프(서버 경로)·쓰기 실행자(API 경로)·읽기 실행자(로그 플러시)
+        # 세 군데서 접근하므로 트랜잭션은 _write_lock으로 직렬화한다.
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
         self._conn.row_factory = sqlite3.Row
+        # 쓰기 연결 트랜잭션 가드: 서로 다른 스레드의 BEGIN/COMMIT이 겹치면
+        # 한쪽 커밋이 다른 쪽의 진행 중 문장을 흡수/폐기할 수 있다.
+        # _bootstrap()도 이 락을 잡으므로 반드시 먼저 만들어 둔다.
+        self._write_lock = threading.Lock()
         self._bootstrap()
-        self._log_seq_cache: dict[str, int] = {}
+        # WAL 리더는 쓰기와 서로 막지 않으므로 읽기 전용 연결 풀을 따로 둔다.
+        # check_same_thread=False: 실행자 스레드에서 빌려 쓰기 위함.
+        self._read_pool_size = min(4, os.cpu_count() or 2)
+        self._read_pool: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        for _ in range(self._read_pool_size):
+            read_conn = sqlite3.connect(
+                f"file:{db_path}?mode=ro", uri=True, check_same_thread=False, cached_statements=256
+            )
+            read_conn.row_factory = sqlite3.Row
+            read_conn.executescript("PRAGMA busy_timeout=5000; PRAGMA mmap_size=268435456;")
+            self._read_pool.put(read_conn)
+        # HTTP 핸들러가 이벤트 루프를 막지 않고 스토리지를 부를 때 쓰는 실행자.
+        # 쓰기는 단일 워커로 직렬화를 유지하고, 읽기는 풀 크기만큼 병렬로 돈다.
+        self._write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="storage-write")
+        self._read_executor = ThreadPoolExecutor(
+            max_workers=self._read_pool_size, thread_name_prefix="storage-read"
+        )
+        # 로그 행은 줄 단위 커밋 대신 모아서 executemany로 기록한다.
+        self._log_buffer: list[tuple[str, str, int, str, str]] = []
+        self._log_buffer_started = 0.0
+        self._log_lock = threading.Lock()
+        # 상태별 작업 수를 메모리에 유지해 비어 있는 상태 조회를 쿼리 없이 끝낸다.
+        self._status_counts: dict[str, int] = self._bootstrap_status_counts()
+        # ETag 계산용 버전 카운터: 변경이 있을 때만 올라간다.
+        self._jobs_version = 0
+        self._job_versions: dict[str, int] = {}
 
     def close(self) -> None:
+        self.flush_job_logs()
+        # 장수 연결이 모은 통계로 쿼리 플래너 정보를 갱신해 두고 닫는다.
+        with suppress(sqlite3.Error):
+            self._conn.execute("PRAGMA optimize")
         self._conn.close()
+        for _ in range(self._read_pool_size):
+            with suppress(queue.Empty):
+                self._read_pool.get_nowait().close()
+        self._write_executor.shutdown(wait=True)
+        self._read_executor.shutdown(wait=True)
+
+    async def run_read(self, fn, /, *args, **kwargs):
+        """읽기 호출을 읽기 실행자에서 수행한다 (이벤트 루프 비차단)."""
+        call = functools.partial(fn, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self._read_executor, call)
+
+    async def run_write(self, fn, /, *args, **kwargs):
+        """쓰기 호출을 단일 워커 실행자에서 직렬로 수행한다."""
+        call = functools.partial(fn, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self._write_executor, call)
+
+    @contextmanager
+    def read_connection(self) -> Iterator[sqlite3.Connection]:
+        """읽기 전용 연결을 빌려준다. 반납은 컨텍스트 종료 시 자동이다."""
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+
+    def pool_stats(self) -> dict[str, int]:
+        return {"size": self._read_pool_size, "idle": self._read_pool.qsize()}
 
     def _bootstrap(self) -> None:
-        with self._conn:
+        # WAL이면 upsert가 진행되는 동안에도 읽기가 막히지 않고, NORMAL 동기화로
+        # 커밋 비용이 WAL append 수준으로 내려간다 (fsync는 체크포인트 시점에만).
+        self._conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-65536;
+            PRAGMA busy_timeout=5000;
+            """
+        )
+        self._stash_legacy_jobs()
+        with self._write_lock, self._conn:
             self._conn.executescript(_DB_SCHEMA)
+        self._restore_legacy_jobs()
+
+    def _stash_legacy_jobs(self) -> None:
+        """구버전 TEXT 타임스탬프 스키마의 jobs 테이블을 재구축 대상으로 치워 둔다.
+
+        CREATE TABLE IF NOT EXISTS는 기존 테이블의 컬럼 친화성을 바꾸지 못하고,
+        TEXT 친화성 컬럼은 epoch 정수 바인딩마저 숫자 문자열로 강제한다.
+        created_at이 INTEGER가 아니면 테이블을 jobs_legacy로 밀어 두고
+        _DB_SCHEMA가 정수 스키마로 새로 만들게 한다.
+        """
+        row = self._conn.execute(
+            "SELECT type FROM pragma_table_info('jobs') WHERE name='created_at'"
+        ).fetchone()
+        if row is None or row["type"].upper() == "INTEGER":
+            return
+        with self._write_lock, self._conn:
+            # 인덱스는 이름을 유지한 채 테이블을 따라가므로 미리 지워야
+            # _DB_SCHEMA의 CREATE INDEX IF NOT EXISTS가 새 테이블에 다시 만든다.
+            self._conn.execute("DROP INDEX IF EXISTS idx_jobs_status_created")
+            self._conn.execute("ALTER TABLE jobs RENAME TO jobs_legacy")
+
+    def _restore_legacy_jobs(self) -> None:
+        """jobs_legacy 행을 타임스탬프만 변환해 새 jobs 테이블로 옮긴다.
+
+        _stash 이후 재기동으로 중단됐더라도 테이블 존재 여부로 재개하므로
+        마이그레이션은 crash-safe하다.
+        """
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='jobs_legacy'"
+        ).fetchone()
+        if exists is None:
+            return
+        with self._write_lock, self._conn:
+            for row in self._conn.execute("SELECT * FROM jobs_legacy").fetchall():
+                params = {column: row[column] for column in _JOB_COLUMNS}
+                params["created_at"] = _coerce_epoch_us(params["created_at"])
+                params["finished_at"] = _coerce_epoch_us(params["finished_at"])
+                self._conn.execute(_UPSERT_JOB_SQL, params)
+            self._conn.execute("DROP TABLE jobs_legacy")
+
+    def _bootstrap_status_counts(self) -> dict[str, int]:
+        counts = {status.value: 0 for status in JobStatus}
+        for row in self._conn.execute("SELECT status, COUNT(*) AS cnt FROM jobs GROUP BY status"):
+            counts[row["status"]] = row["cnt"]
+        return counts
+
+    def _job_status(self, job_id: str) -> str | None:
+        row = self._conn.execute("SELECT status FROM jobs WHERE job_id=?", (job_id,)).fetchone()
+        return row["status"] if row else None
+
+    @property
+    def jobs_version(self) -> int:
+        return self._jobs_version
+
+    def job_version(self, job_id: str) -> int:
+        return self._job_versions.get(job_id, 0)
+
+    def _bump_job_version(self, job_id: str) -> None:
+        self._jobs_version += 1
+        self._job_versions[job_id] = self._job_versions.get(job_id, 0) + 1
+
+    def _shift_status_count(self, old: str | None, new: str | None) -> None:
+        if old == new:
+            return
+        if old is not None:
+            self._status_counts[old] = max(self._status_counts.get(old, 0) - 1, 0)
+        if new is not None:
+            self._status_counts[new] = self._status_counts.get(new, 0) + 1
 
     # Job CRUD ------------------------------------------------------------
 
     def upsert_job(self, job: Job) -> None:
-        repositories = [repo.__dict__ for repo in job.repositories]
+        old_status = self._job_status(job.job_id)
+        repositories = [repo.to_dict() for repo in job.repositories]
         payload = {
             "job_id": job.job_id,
             "prompt": job.prompt,
             "status": job.status.value,
             "target_node_id": job.target_node_id,
-            "requested_tags": json.dumps(job.requested_tags),
-            "repositories": json.dumps(repositories),
-            "metadata": json.dumps(job.metadata),
+            "requested_tags": json_dumps(job.requested_tags),
+            "repositories": json_dumps(repositories),
+            "metadata": json_dumps(job.metadata),
             "log_path": job.log_path,
             "result_summary": job.result_summary,
             "error_message": job.error_message,
-            "created_at": job.created_at.isoformat(),
-            "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+            "created_at": _to_epoch_us(job.created_at),
+            "finished_at": _to_epoch_us(job.finished_at),
         }
-        columns = ", ".join(payload.keys())
-        placeholders = ", ".join([":" + key for key in payload.keys()])
-        update_clause = ", ".join([f"{key}=excluded.{key}" for key in payload.keys() if key != "job_id"])
-        sql = f"""
-        INSERT INTO jobs ({columns})
-        VALUES ({placeholders})
-        ON CONFLICT(job_id) DO UPDATE SET {update_clause}
-        """
-        with self._conn:
-            self._conn.execute(sql, payload)
+        with self._write_lock, self._conn:
+            self._conn.execute(_UPSERT_JOB_SQL, payload)
+        self._shift_status_count(old_status, job.status.value)
+        self._bump_job_version(job.job_id)
 
     def get_job(self, job_id: str) -> Job | None:
-        row = self._conn.execute("SELECT * FROM jobs WHERE job_id=?", (job_id,)).fetchone()
+        with self.read_connection() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE job_id=?", (job_id,)).fetchone()
         return self._row_to_job(row) if row else None
 
     def list_jobs(self, limit: int = 50, status: JobStatus | None = None) -> list[Job]:
+        if status is not None and not self._status_counts.get(status.value):
+            return []
         sql = "SELECT * FROM jobs"
         params: list[object] = []
         if status is not None:
             sql += " WHERE status=?"
             params.append(status.value)
-        sql += " ORDER BY datetime(created_at) DESC LIMIT ?"
+        sql += " ORDER BY created_at DESC LIMIT ?"
         params.append(limit)
-        rows = self._conn.execute(sql, params).fetchall()
+        with self.read_connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
         return [self._row_to_job(row) for row in rows]
 
+    def list_job_payloads(self, limit: int = 50, status: JobStatus | None = None) -> list[dict[str, object]]:
+        """목록 응답용 페이로드를 Job 객체를 거치지 않고 행에서 바로 만든다."""
+        if status is not None and not self._status_counts.get(status.value):
+            return []
+        sql = "SELECT * FROM jobs"
+        params: list[object] = []
+        if status is not None:
+            sql += " WHERE status=?"
+            params.append(status.value)
+        sql += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+        with self.read_connection() as conn:
+            return [self._row_to_payload(row) for row in conn.execute(sql, params)]
+
+    def _row_to_payload(self, row: sqlite3.Row) -> dict[str, object]:
+        return {
+            "job_id": row["job_id"],
+            "prompt": row["prompt"],
+            "status": row["status"],
+            "target_node_id": row["target_node_id"],
+            "requested_tags": json_loads(row["requested_tags"]) or [],
+            "repositories": json_loads(row["repositories"]) or [],
+            "metadata": json_loads(row["metadata"]) or {},
+            "log_path": row["log_path"],
+            "result_summary": row["result_summary"],
+            "error_message": row["error_message"],
+            "created_at": _format_db_datetime(row["created_at"]),
+            "finished_at": _format_db_datetime(row["finished_at"]),
+        }
+
     def list_jobs_by_status(self, statuses: Sequence[JobStatus], limit: int = 100) -> list[Job]:
         if not statuses:
             return []
+        if not any(self._status_counts.get(status.value) for status in statuses):
+            return []
         placeholders = ", ".join(["?"] * len(statuses))
-        sql = f"SELECT * FROM jobs WHERE status IN ({placeholders}) ORDER BY datetime(created_at) ASC LIMIT ?"
+        sql = f"SELECT * FROM jobs WHERE status IN ({placeholders}) ORDER BY created_at ASC LIMIT ?"
         params = [status.value for status in statuses]
         params.append(limit)
-        rows = self._conn.execute(sql, params).fetchall()
+        with self.read_connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
         return [self._row_to_job(row) for row in rows]
 
     def update_job_status(
@@ -151,15 +431,24 @@ class Storage:
                 params[key] = value
 
         if status in {JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED}:
-            updates.append("finished_at = datetime('now')")
+            updates.append("finished_at = :finished_at")
+            params["finished_at"] = _to_epoch_us(datetime.now(timezone.utc))
 
         if not updates:
             return
 
+        if status in {JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED}:
+            # 종료 상태 전이는 로그 버퍼를 먼저 비워 행 누락을 막는다.
+            self.flush_job_logs()
+
+        old_status = self._job_status(job_id)
         params["job_id"] = job_id
         sql = f"UPDATE jobs SET {' , '.join(updates)} WHERE job_id=:job_id"
-        with self._conn:
+        with self._write_lock, self._conn:
             self._conn.execute(sql, params)
+        if old_status is not None:
+            self._shift_status_count(old_status, status.value)
+            self._bump_job_version(job_id)
 
     def mark_job_queued(self, job_id: str, node_id: str) -> None:
         sql = """
@@ -167,8 +456,9 @@ class Storage:
         SET status = ?, target_node_id = ?
         WHERE job_id = ? AND status IN (?, ?)
         """
-        with self._conn:
-            self._conn.execute(
+        old_status = self._job_status(job_id)
+        with self._write_lock, self._conn:
+            cursor = self._conn.execute(
                 sql,
                 (
                     JobStatus.QUEUED.value,
@@ -178,6 +468,9 @@ class Storage:
                     JobStatus.QUEUED.value,
                 ),
             )
+        if cursor.rowcount > 0:
+            self._shift_status_count(old_status, JobStatus.QUEUED.value)
+            self._bump_job_version(job_id)
 
     def assign_job(self, job_id: str, node_id: str) -> bool:
         sql = """
@@ -185,7 +478,8 @@ class Storage:
         SET status = ?, target_node_id = ?, result_summary = ?
         WHERE job_id = ? AND status IN (?, ?)
         """
-        with self._conn:
+        old_status = self._job_status(job_id)
+        with self._write_lock, self._conn:
             cursor = self._conn.execute(
                 sql,
                 (
@@ -197,32 +491,53 @@ class Storage:
                     JobStatus.QUEUED.value,
                 ),
             )
+        if cursor.rowcount > 0:
+            self._shift_status_count(old_status, JobStatus.RUNNING.value)
+            self._bump_job_version(job_id)
         return cursor.rowcount > 0
 
     # Job logs ------------------------------------------------------------
 
     def append_job_log(self, job_id: str, level: str, message: str, timestamp: datetime | None = None) -> None:
-        seq = self._log_seq_cache.get(job_id)
-        if seq is None:
-            row = self._conn.execute("SELECT MAX(seq) FROM job_logs WHERE job_id=?", (job_id,)).fetchone()
-            seq = row[0] if row and row[0] is not None else 0
-        seq += 1
-        self._log_seq_cache[job_id] = seq
-        payload = {
-            "job_id": job_id,
-            "seq": seq,
-            "timestamp": (timestamp or datetime.utcnow()).isoformat(),
-            "level": level,
-            "message": message,
-        }
-        sql = """
-        INSERT INTO job_logs (job_id, seq, timestamp, level, message)
-        VALUES (:job_id, :seq, :timestamp, :level, :message)
-        """
-        with self._conn:
-            self._conn.execute(sql, payload)
+        # 행마다 datetime+isoformat을 만들지 않고 epoch 마이크로초 정수로 적는다.
+        ts_us = _to_epoch_us(timestamp) if timestamp is not None else int(time.time() * 1_000_000)
+        now = time.monotonic()
+        with self._log_lock:
+            if not self._log_buffer:
+                self._log_buffer_started = now
+            # job_id가 두 번 들어가는 건 플러시 SQL의 seq 서브쿼리 바인딩용.
+            self._log_buffer.append((job_id, job_id, ts_us, level, message))
+            should_flush = (
+                len(self._log_buffer) >= _LOG_FLUSH_ROWS
+                or now - self._log_buffer_started >= _LOG_FLUSH_AGE
+            )
+        if should_flush:
+            self.flush_job_logs()
+
+    def flush_job_logs(self) -> None:
+        """버퍼에 쌓인 로그 행을 한 트랜잭션으로 기록한다."""
+        with self._log_lock:
+            rows = self._log_buffer
+            if not rows:
+                return
+            self._log_buffer = []
+        # seq는 삽입 시점에 DB에서 계산한다. (job_id, seq) PK 인덱스 덕에 MAX는
+        # O(log N)이고, executemany는 행을 순서대로 실행하므로 같은 작업의 행이
+        # 한 배치에 여러 개 있어도 서브쿼리가 직전 삽입을 반영해 seq가 이어진다.
+        sql = (
+            "INSERT INTO job_logs (job_id, seq, timestamp, level, message) "
+            "VALUES (?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM job_logs WHERE job_id = ?), ?, ?, ?)"
+        )
+        with self._write_lock, self._conn:
+            self._conn.executemany(sql, rows)
 
     def list_job_logs(self, job_id: str, *, limit: int = 200, after_seq: int | None = None) -> list[dict[str, str]]:
+        return list(self.iter_job_logs(job_id, limit=limit, after_seq=after_seq))
+
+    def iter_job_logs(self, job_id: str, *, limit: int = 200, after_seq: int | None = None) -> Iterator[dict[str, str]]:
+        """로그 행을 전부 적재하지 않고 한 행씩 돌려준다."""
+        # read-your-writes: 버퍼에 남은 행부터 커밋하고 읽는다.
+        self.flush_job_logs()
         sql = "SELECT * FROM job_logs WHERE job_id=?"
         params: list[object] = [job_id]
         if after_seq is not None:
@@ -230,8 +545,19 @@ class Storage:
             params.append(after_seq)
         sql += " ORDER BY seq ASC LIMIT ?"
         params.append(limit)
-        rows = self._conn.execute(sql, params).fetchall()
-        return [dict(row) for row in rows]
+        with self.read_connection() as conn:
+            cursor = conn.execute(sql, params)
+            # dict(sqlite3.Row)보다 컬럼 튜플 + zip이 행당 할당이 적다.
+            columns = tuple(entry[0] for entry in cursor.description)
+            # 행 단위 왕복 대신 64행씩 묶어 가져온다 (스트리밍 응답과 궁합).
+            while True:
+                rows = cursor.fetchmany(64)
+                if not rows:
+                    break
+                for row in rows:
+                    entry = dict(zip(columns, row))
+                    entry["timestamp"] = _format_db_datetime(entry["timestamp"])
+                    yield entry
 
     def set_user_token(
         self,
@@ -249,7 +575,7 @@ class Storage:
             "access_token": access_token,
             "refresh_token": refresh_token,
             "expires_at": expires_at.isoformat() if expires_at else None,
-            "metadata": json.dumps(metadata or {}),
+            "metadata": json_dumps(metadata or {}),
         }
         sql = """
         INSERT INTO user_tokens (user_id, provider, access_token, refresh_token, expires_at, metadata)
@@ -260,23 +586,47 @@ class Storage:
             expires_at=excluded.expires_at,
             metadata=excluded.metadata
         """
-        with self._conn:
+        with self._write_lock, self._conn:
             self._conn.execute(sql, payload)
 
     def get_user_token(self, user_id: str, provider: str) -> dict[str, object] | None:
-        row = self._conn.execute(
-            "SELECT * FROM user_tokens WHERE user_id=? AND provider=?",
-            (user_id, provider),
-        ).fetchone()
+        with self.read_connection() as conn:
+            row = conn.execute(
+                "SELECT * FROM user_tokens WHERE user_id=? AND provider=?",
+                (user_id, provider),
+            ).fetchone()
         if not row:
             return None
         data = dict(row)
         metadata_raw = data.get("metadata")
-        data["metadata"] = json.loads(metadata_raw) if metadata_raw else {}
+        data["metadata"] = json_loads(metadata_raw) if metadata_raw else {}
         return data
 
     def dequeue_pending_job(self, candidate_node_id: str | None) -> Job | None:
-        sql = "SELECT * FROM jobs WHERE status=? ORDER BY datetime(created_at) ASC LIMIT 1"
+        if not self._status_counts.get(JobStatus.QUEUED.value):
+            return None
+        if not _SUPPORTS_RETURNING:
+            return self._dequeue_pending_job_fallback(candidate_node_id)
+        # 선두 QUEUED 작업을 한 문장으로 집어 RUNNING으로 옮긴다 — SELECT 후
+        # upsert로 되돌리는 두 번의 왕복(과 경쟁)을 없앤다.
+        with self._write_lock, self._conn:
+            row = self._conn.execute(
+                _DEQUEUE_JOB_SQL,
+                {
+                    "running": JobStatus.RUNNING.value,
+                    "node_id": candidate_node_id,
+                    "queued": JobStatus.QUEUED.value,
+                },
+            ).fetchone()
+        if not row:
+            return None
+        self._shift_status_count(JobStatus.QUEUED.value, JobStatus.RUNNING.value)
+        self._bump_job_version(row["job_id"])
+        return self._row_to_job(row)
+
+    def _dequeue_pending_job_fallback(self, candidate_node_id: str | None) -> Job | None:
+        """RETURNING 미지원 SQLite용 기존 2단계 경로."""
+        sql = "SELECT * FROM jobs WHERE status=? ORDER BY created_at ASC LIMIT 1"
         row = self._conn.execute(sql, (JobStatus.QUEUED.value,)).fetchone()
         if not row:
             return None
@@ -292,30 +642,31 @@ class Storage:
         payload = {
             "node_id": node.node_id,
             "display_name": node.display_name,
-            "tags": json.dumps(node.tags),
-            "capabilities": json.dumps(node.capabilities),
+            "tags": json_dumps(node.tags),
+            "capabilities": json_dumps(node.capabilities),
             "status": node.status,
             "last_seen": node.last_seen.isoformat(),
         }
-        columns = ", ".join(payload.keys())
-        placeholders = ", ".join([":" + key for key in payload.keys()])
-        update_clause = ", ".join([f"{key}=excluded.{key}" for key in payload.keys() if key != "node_id"])
-        sql = f"""
-        INSERT INTO nodes ({columns})
-        VALUES ({placeholders})
-        ON CONFLICT(node_id) DO UPDATE SET {update_clause}
-        """
-        with self._conn:
-            self._conn.execute(sql, payload)
+        with self._write_lock, self._conn:
+            self._conn.execute(_UPSERT_NODE_SQL, payload)
+
+    def touch_nodes(self, entries: Iterable[tuple[str, datetime]]) -> None:
+        """last_seen만 바뀐 노드들을 한 트랜잭션으로 일괄 갱신한다."""
+        rows = [(last_seen.isoformat(), node_id) for node_id, last_seen in entries]
+        if not rows:
+            return
+        with self._write_lock, self._conn:
+            self._conn.executemany("UPDATE nodes SET last_seen = ? WHERE node_id = ?", rows)
 
     def list_nodes(self) -> list[NodeMetadata]:
-        rows = self._conn.execute("SELECT * FROM nodes ORDER BY display_name").fetchall()
+        with self.read_connection() as conn:
+            rows = conn.execute("SELECT * FROM nodes ORDER BY display_name").fetchall()
         return [self._row_to_node(row) for row in rows]
 
     def _row_to_job(self, row: sqlite3.Row) -> Job:
-        repositories = [RepositorySpec(**repo) for repo in json.loads(row["repositories"]) or []]
-        requested_tags = json.loads(row["requested_tags"]) or []
-        metadata = json.loads(row["metadata"]) or {}
+        repositories = list(_decode_repositories(row["repositories"]))
+        requested_tags = json_loads(row["requested_tags"]) or []
+        metadata = json_loads(row["metadata"]) or {}
         return Job(
             job_id=row["job_id"],
             prompt=row["prompt"],
@@ -327,16 +678,16 @@ class Storage:
             log_path=row["log_path"],
             result_summary=row["result_summary"],
             error_message=row["error_message"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            finished_at=datetime.fromisoformat(row["finished_at"]) if row["finished_at"] else None,
+            created_at=_from_db_datetime(row["created_at"]),
+            finished_at=_from_db_datetime(row["finished_at"]),
         )
 
     def _row_to_node(self, row: sqlite3.Row) -> NodeMetadata:
         return NodeMetadata(
             node_id=row["node_id"],
             display_name=row["display_name"],
-            tags=json.loads(row["tags"]) or [],
-            capabilities=json.loads(row["capabilities"]) or {},
+            tags=json_loads(row["tags"]) or [],
+            capabilities=json_loads(row["capabilities"]) or {},
             status=row["status"],
             last_seen=datetime.fromisoformat(row["last_seen"]),
         )
@@ -6,21 +6,110 @@ import argparse
 import asyncio
 import asyncio.subprocess
 import contextlib
+import functools
 import json
 import logging
 import os
+import queue
 import shlex
 import shutil
+import struct
 import sys
+import threading
+import uuid
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Sequence
+from typing import Any, Sequence
 from urllib.parse import urlparse
 
 import websockets
 
+try:  # orjson이 있으면 C 구현으로 직렬화 비용을 줄인다.
+    import orjson
+
+    def json_dumps(payload: Any) -> bytes:
+        return orjson.dumps(payload)
+
+    json_loads = orjson.loads
+except ImportError:  # pragma: no cover - 선택 의존성
+
+    def json_dumps(payload: Any) -> bytes:
+        return json.dumps(payload).encode()
+
+    json_loads = json.loads
+
 LOGGER = logging.getLogger(__name__)
 
+# job.status 프레임은 스키마가 고정이라 dict 구성 + 전체 인코딩 대신
+# 상수 조각을 이어 붙인다. job_id/status는 안전한 값이고, 자유 텍스트
+# 필드(요약/오류)만 JSON 이스케이프를 거친다.
+_STATUS_PREFIX = b'{"type":"job.status","job_id":"'
+
+# 로그 레벨 -> 숫자 우선순위. job.assign의 log_level 임계와 비교한다.
+_LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+_DEFAULT_LEVEL = _LEVELS["info"]
+
+
+def _job_status_frame(job_id: str, status: str, field: str | None = None, value: str | None = None) -> bytes:
+    frame = _STATUS_PREFIX + job_id.encode() + b'","status":"' + status.encode() + b'"'
+    if field is not None:
+        frame += b',"' + field.encode() + b'":' + json_dumps(value)
+    return frame + b"}"
+
+
+class _LogWriter:
+    """job.log 파일 쓰기를 이벤트 루프 밖의 전용 스레드에서 배치로 처리한다.
+
+    작업 시작 때 연 fd에 os.write만 수행한다 — 줄당 시스템 콜이 하나고,
+    큐에 쌓인 연속 항목은 최대 64개까지 모아 한 번의 쓰기로 합친다.
+    fd 닫기도 큐를 거치므로 앞서 들어온 쓰기가 모두 끝난 뒤 닫힌다.
+    """
+
+    _MAX_BATCH = 64
+
+    def __init__(self) -> None:
+        # data가 None이면 해당 fd를 닫으라는 표식이다.
+        self._queue: queue.Queue[tuple[int, bytes | None]] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, fd: int, data: bytes) -> None:
+        self._queue.put((fd, data))
+
+    def close_fd(self, fd: int) -> None:
+        self._queue.put((fd, None))
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            # 큐 순서를 보존하면서 같은 fd로 이어지는 쓰기만 합친다.
+            index = 0
+            while index < len(batch):
+                fd, data = batch[index]
+                if data is None:
+                    with contextlib.suppress(OSError):
+                        os.close(fd)
+                    index += 1
+                    continue
+                chunks = [data]
+                while (
+                    index + 1 < len(batch)
+                    and batch[index + 1][0] == fd
+                    and batch[index + 1][1] is not None
+                ):
+                    index += 1
+                    chunks.append(batch[index][1])
+                try:
+                    os.write(fd, b"".join(chunks))
+                except OSError as exc:
+                    LOGGER.warning("로그 파일 쓰기 실패(fd=%s): %s", fd, exc)
+                index += 1
+
 
 @dataclass
 class NodeContext:
@@ -35,6 +124,18 @@ class NodeContext:
     metadata_sent: bool = False
     active_job_id: str | None = None
     current_log_path: Path | None = None
+    # 현재 작업의 job.log fd. _execute_job이 열고 finally에서 닫는다.
+    log_fd: int | None = None
+    # 이 우선순위 미만의 로그는 파일에만 남기고 WS로 보내지 않는다.
+    log_threshold: int = _DEFAULT_LEVEL
+    # 줄 단위 WS 프레임 대신 로그를 모아 보내는 큐. _run_client가 채운다.
+    log_queue: asyncio.Queue | None = None
+    # 모든 송신 프레임이 거치는 단일 큐 — 동시 send 경합과 끼어들기를 없앤다.
+    send_queue: asyncio.Queue | None = None
+    # 파일 쓰기를 담당하는 백그라운드 스레드. _run_client가 채운다.
+    log_writer: _LogWriter | None = None
+    # 시작 시점의 환경 변수 스냅샷 — 작업마다 os.environ을 다시 복사하지 않는다.
+    base_env: dict[str, str] | None = None
 
     def mark_busy(self, job_id: str) -> None:
         self.active_job_id = job_id
@@ -42,13 +143,38 @@ class NodeContext:
     def mark_idle(self) -> None:
         self.active_job_id = None
         self.current_log_path = None
+        self.log_fd = None
+        self.log_threshold = _DEFAULT_LEVEL
+
+
+async def _queue_send(websocket, context: NodeContext | None, frame: str | bytes) -> None:
+    """송신 프레임을 펌프 큐에 싣는다. 큐가 없으면 바로 보낸다."""
+    if context is not None and context.send_queue is not None:
+        context.send_queue.put_nowait(frame)
+        return
+    await websocket.send(frame)
+
+
+async def _send_pump(websocket, queue_: asyncio.Queue) -> None:
+    """단일 코루틴이 송신을 전담해 여러 태스크의 send 경합을 없앤다.
+
+    WebSocket 프레임은 메시지 경계가 있어 하나로 합칠 수 없으므로
+    순서대로 내보내기만 한다 — 로그 배치가 상태 프레임을 앞지르는
+    일이 없어져 전송 순서도 안정된다.
+    """
+    while True:
+        frame = await queue_.get()
+        await websocket.send(frame)
 
 
 async def _receiver(websocket, context: NodeContext) -> None:
     async for message in websocket:
+        # NOTE: 타입 프리픽스만 읽고 파싱을 건너뛰는 최적화는 여기서는 성립하지
+        # 않는다 — welcome/job.assign/message 모두 본문 필드를 실제로 사용하므로
+        # 어차피 전체 파싱이 필요하다. orjson이 bytes를 바로 파싱하는 것으로 충분.
         try:
-            payload = json.loads(message)
-        except json.JSONDecodeError:
+            payload = json_loads(message)
+        except ValueError:
             LOGGER.warning("수신한 메시지를 JSON으로 파싱할 수 없습니다: %s", message)
             continue
 
@@ -76,7 +202,7 @@ async def _send_node_hello(websocket, context: NodeContext) -> None:
         "tags": context.tags,
         "capabilities": {},
     }
-    await websocket.send(json.dumps(message))
+    await _queue_send(websocket, context, json_dumps(message))
     context.metadata_sent = True
 
 
@@ -88,15 +214,8 @@ async def _handle_job_assign(websocket, context: NodeContext, payload: dict[str,
 
     if context.active_job_id is not None:
         LOGGER.warning("이미 작업이 실행 중입니다. 새로운 작업 %s 를 거절합니다.", job_id)
-        await websocket.send(
-            json.dumps(
-                {
-                    "type": "job.status",
-                    "job_id": job_id,
-                    "status": "failed",
-                    "error_message": "node is busy",
-                }
-            )
+        await _queue_send(
+            websocket, context, _job_status_frame(str(job_id), "failed", "error_message", "node is busy")
         )
         return
 
@@ -108,15 +227,9 @@ async def _handle_job_assign(websocket, context: NodeContext, payload: dict[str,
             repo_url = repo.get("url") if isinstance(repo, dict) else repo
             print(f"  - repo: {repo_url}")
     context.mark_busy(job_id)
-    await websocket.send(
-        json.dumps(
-            {
-                "type": "job.status",
-                "job_id": job_id,
-                "status": "running",
-                "result_summary": "job started",
-            }
-        )
+    context.log_threshold = _LEVELS.get(str(payload.get("log_level", "info")).lower(), _DEFAULT_LEVEL)
+    await _queue_send(
+        websocket, context, _job_status_frame(str(job_id), "running", "result_summary", "job started")
     )
 
     asyncio.create_task(_execute_job(websocket, context, payload))
@@ -130,36 +243,55 @@ async def _execute_job(websocket, context: NodeContext, payload: dict[str, objec
 
     try:
         if workdir.exists():
-            shutil.rmtree(workdir)
+            # O(파일 수) 삭제로 작업 시작을 막지 않는다: 이름만 바꿔 치우고
+            # 실제 삭제는 스레드로 백그라운드에서 돌린다.
+            trash = workdir.parent / f".trash-{uuid.uuid4().hex}"
+            os.rename(workdir, trash)
+            asyncio.create_task(asyncio.to_thread(shutil.rmtree, trash, ignore_errors=True))
         workdir.mkdir(parents=True, exist_ok=True)
         context.current_log_path = workdir / "job.log"
+        context.log_fd = os.open(str(context.current_log_path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
         await _send_job_log(websocket, job_id, f"작업 디렉터리 생성: {workdir}", context=context)
 
         prompt_path = workdir / "prompt.txt"
-        prompt_path.write_text(prompt, encoding="utf-8")
-        await _send_job_log(websocket, job_id, "프롬프트 파일 저장 완료", context=context)
+        # 프롬프트 파일 쓰기와 레포지토리 클론은 서로 의존성이 없다 —
+        # 클론(네트워크, 수 초)이 도는 동안 로컬 파일 I/O를 숨긴다.
+        prompt_task = asyncio.create_task(
+            asyncio.to_thread(prompt_path.write_text, prompt, encoding="utf-8")
+        )
 
-        if repositories:
-            for repo_spec in repositories:
-                if not isinstance(repo_spec, dict):
-                    continue
-                url = str(repo_spec.get("url", "")).strip()
-                if not url:
-                    continue
-                branch = repo_spec.get("branch")
-                subdirectory = repo_spec.get("subdirectory")
-                await _send_job_log(websocket, job_id, f"레포지토리 클론: {url}", context=context)
-                ok = await _clone_repository(websocket, job_id, url, branch, workdir, context)
-                if not ok:
-                    raise RuntimeError(f"failed to clone {url}")
-                if subdirectory:
-                    await _send_job_log(websocket, job_id, f"서브디렉터리 지정: {subdirectory}", context=context)
+        clone_specs: list[tuple[str, object, object]] = []
+        for repo_spec in repositories:
+            if not isinstance(repo_spec, dict):
+                continue
+            url = str(repo_spec.get("url", "")).strip()
+            if not url:
+                continue
+            clone_specs.append((url, repo_spec.get("branch"), repo_spec.get("subdirectory")))
+
+        for url, _, _ in clone_specs:
+            await _send_job_log(websocket, job_id, f"레포지토리 클론: {url}", context=context)
+        results = await asyncio.gather(
+            prompt_task,
+            *(
+                _clone_repository(websocket, job_id, url, branch, workdir, context)
+                for url, branch, _ in clone_specs
+            ),
+        )
+        await _send_job_log(websocket, job_id, "프롬프트 파일 저장 완료", context=context)
+        for (url, _, subdirectory), ok in zip(clone_specs, results[1:]):
+            if not ok:
+                raise RuntimeError(f"failed to clone {url}")
+            if subdirectory:
+                await _send_job_log(websocket, job_id, f"서브디렉터리 지정: {subdirectory}", context=context)
 
         if context.codernetes_command:
             await _send_job_log(websocket, job_id, "Codernetes 명령 실행 시작", context=context)
-            env = os.environ.copy()
-            env["CODERNETES_PROMPT"] = prompt
-            env["CODERNETES_PROMPT_FILE"] = str(prompt_path)
+            env = {
+                **(context.base_env or os.environ),
+                "CODERNETES_PROMPT": prompt,
+                "CODERNETES_PROMPT_FILE": str(prompt_path),
+            }
             success = await _run_command(
                 websocket,
                 job_id,
@@ -173,31 +305,22 @@ async def _execute_job(websocket, context: NodeContext, payload: dict[str, objec
         else:
             await _send_job_log(websocket, job_id, "Codernetes 명령이 정의되지 않아 실행을 건너뜁니다.", context=context)
 
-        await websocket.send(
-            json.dumps(
-                {
-                    "type": "job.status",
-                    "job_id": job_id,
-                    "status": "succeeded",
-                    "result_summary": "job completed successfully",
-                }
-            )
+        await _queue_send(
+            websocket, context, _job_status_frame(job_id, "succeeded", "result_summary", "job completed successfully")
         )
         await _send_job_log(websocket, job_id, "작업 완료", level="info", context=context)
     except Exception as exc:  # noqa: BLE001
         LOGGER.exception("Job %s 실행 중 오류", job_id)
-        await websocket.send(
-            json.dumps(
-                {
-                    "type": "job.status",
-                    "job_id": job_id,
-                    "status": "failed",
-                    "error_message": str(exc),
-                }
-            )
-        )
+        await _queue_send(websocket, context, _job_status_frame(job_id, "failed", "error_message", str(exc)))
         await _send_job_log(websocket, job_id, f"오류: {exc}", level="error", context=context)
     finally:
+        if context.log_fd is not None:
+            if context.log_writer is not None:
+                # 큐에 남은 쓰기가 모두 끝난 뒤 쓰기 스레드가 닫는다.
+                context.log_writer.close_fd(context.log_fd)
+            else:
+                with contextlib.suppress(OSError):
+                    os.close(context.log_fd)
         context.mark_idle()
         if not context.preserve_workdir:
             asyncio.create_task(_cleanup_workdir(workdir, context.cleanup_delay))
@@ -206,26 +329,86 @@ async def _execute_job(websocket, context: NodeContext, payload: dict[str, objec
 async def _send_job_log(
     websocket,
     job_id: str,
-    message: str,
+    message: str | bytes,
     *,
     level: str = "info",
     context: NodeContext | None = None,
 ) -> None:
+    # 서브프로세스 출력은 bytes 그대로 받는다 — 디코드/재인코드 왕복을 피하고
+    # 파일과 바이너리 배치 프레임에 원문 바이트를 그대로 싣는다.
     if context and context.current_log_path is not None:
-        with context.current_log_path.open("a", encoding="utf-8") as fp:
-            fp.write(f"[{level}] {message}\n")
-    await websocket.send(
-        json.dumps(
+        body = bytes(message) if isinstance(message, (bytes, bytearray)) else message.encode("utf-8", "replace")
+        line = b"[" + level.encode() + b"] " + body + b"\n"
+        if context.log_fd is not None and context.log_writer is not None:
+            context.log_writer.write(context.log_fd, line)
+        else:
+            with context.current_log_path.open("ab") as fp:
+                fp.write(line)
+    if context is not None and _LEVELS.get(level, _DEFAULT_LEVEL) < context.log_threshold:
+        # 임계 미만 레벨은 파일에만 남긴다 — WS 왕복 자체를 생략한다.
+        return
+    if context is not None and context.log_queue is not None:
+        # 플러셔가 큐에 쌓인 항목을 한 프레임으로 묶어 보낸다.
+        context.log_queue.put_nowait({"job_id": job_id, "level": level, "message": message})
+        return
+    await _queue_send(
+        websocket,
+        context,
+        json_dumps(
             {
                 "type": "job.log",
                 "job_id": job_id,
                 "level": level,
-                "message": message,
+                "message": message.decode("utf-8", "replace") if isinstance(message, (bytes, bytearray)) else message,
             }
-        )
+        ),
     )
 
 
+def _encode_log_batch_binary(entries: list[dict[str, object]]) -> bytes:
+    """로그 배치를 [4바이트 헤더 길이][JSON 헤더][본문 바이트] 프레임으로 만든다.
+
+    본문은 메시지 바이트를 그대로 이어 붙이고 길이는 헤더의 lens로 전달하므로
+    셸 출력에 섞인 따옴표/역슬래시를 JSON 이스케이프하지 않는다.
+    """
+    bodies: list[bytes] = []
+    for entry in entries:
+        message = entry["message"]
+        if isinstance(message, (bytes, bytearray)):
+            bodies.append(bytes(message))
+        else:
+            bodies.append(str(message).encode("utf-8", "replace"))
+    header = json_dumps(
+        {
+            "type": "job.log.batch",
+            "job_ids": [entry["job_id"] for entry in entries],
+            "levels": [entry["level"] for entry in entries],
+            "lens": [len(body) for body in bodies],
+        }
+    )
+    return struct.pack(">I", len(header)) + header + b"".join(bodies)
+
+
+async def _log_flusher(websocket, context: NodeContext) -> None:
+    """로그 큐를 비워 한 번의 send로 묶어 보낸다.
+
+    첫 항목은 블로킹으로 기다리고, 그 시점에 즉시 꺼낼 수 있는 항목을
+    전부 끌어모아 바이너리 배치 프레임 하나로 합친다. 출력이 뜸하면
+    사실상 줄 단위 전송과 같고, 폭주하면 프레임 수가 배치 크기만큼 준다.
+    """
+    log_queue = context.log_queue
+    if log_queue is None:
+        return
+    while True:
+        entries = [await log_queue.get()]
+        while True:
+            try:
+                entries.append(log_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        await _queue_send(websocket, context, _encode_log_batch_binary(entries))
+
+
 async def _clone_repository(
     websocket,
     job_id: str,
@@ -236,16 +419,21 @@ async def _clone_repository(
 ) -> bool:
     repo_name = _derive_repo_name(url)
     target = workdir / repo_name
-    cmd = ["git", "clone", "--depth", "1"]
+    # 부분 클론(blob:none) + 단일 브랜치로 받는 바이트를 줄이고,
+    # gc.auto=0으로 클론 직후 유지보수 프로세스가 뜨는 것을 막는다.
+    cmd = ["git", "-c", "gc.auto=0", "clone", "--depth", "1", "--single-branch", "--filter=blob:none"]
     if branch:
         cmd += ["--branch", str(branch)]
     clone_url = _inject_token(url, context.github_token)
     masked_url = _mask_token(clone_url, context.github_token)
     await _send_job_log(websocket, job_id, f"git clone {masked_url}", context=context)
     cmd += [clone_url, str(target)]
-    return await _run_command(websocket, job_id, cmd, cwd=workdir, context=context)
+    # 인증이 필요하면 프롬프트에 매달리지 말고 즉시 실패하게 한다.
+    env = {**(context.base_env or os.environ), "GIT_TERMINAL_PROMPT": "0"}
+    return await _run_command(websocket, job_id, cmd, cwd=workdir, env=env, context=context)
 
 
+@functools.lru_cache(maxsize=512)
 def _derive_repo_name(url: str) -> str:
     parsed = urlparse(url)
     path = parsed.path or url
@@ -293,17 +481,36 @@ async def _run_command(
         stderr=asyncio.subprocess.PIPE,
         cwd=str(cwd),
         env=env,
+        # 스트림 버퍼를 1MiB로 키워 대량 출력에서도 큰 청크 단위로 읽는다.
+        limit=1 << 20,
     )
 
     async def _pipe(stream: asyncio.StreamReader, level: str) -> None:
+        # readline() 왕복 대신 큰 청크로 읽어 로컬에서 줄을 나눈다 —
+        # 출력 1MB당 await 횟수가 줄 수에서 청크 수로 떨어진다.
+        buf = bytearray()
         while True:
-            line = await stream.readline()
-            if not line:
+            chunk = await stream.read(65536)
+            if not chunk:
                 break
+            buf += chunk
+            *lines, rest = buf.split(b"\n")
+            buf = bytearray(rest)
+            for line in lines:
+                # bytearray 분할 결과를 bytes로 고정한다 — 이후 경로의
+                # isinstance(bytes) 분기와 orjson이 bytearray를 받지 않는다.
+                await _send_job_log(
+                    websocket,
+                    job_id,
+                    bytes(line.rstrip(b"\r")),
+                    level=level,
+                    context=context,
+                )
+        if buf:
             await _send_job_log(
                 websocket,
                 job_id,
-                line.decode(errors="replace").rstrip(),
+                bytes(buf).rstrip(b"\r\n"),
                 level=level,
                 context=context,
             )
@@ -325,6 +532,29 @@ async def _cleanup_workdir(workdir: Path, delay: float) -> None:
 
 
 async def _sender(websocket) -> None:
+    # 표준 입력을 이벤트 루프에 직접 연결해 입력마다 스레드 풀을 오가지 않는다.
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    try:
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    except (OSError, ValueError):
+        # 파이프로 연결할 수 없는 환경에서는 기존 블로킹 input 경로로 돌아간다.
+        await _sender_blocking(websocket)
+        return
+
+    while True:
+        print("> ", end="", flush=True)
+        line = await reader.readline()
+        if not line:
+            print("입력을 종료합니다.")
+            await websocket.close(code=1000, reason="Client exit")
+            break
+        trimmed = line.decode().strip()
+        if trimmed:
+            await websocket.send(trimmed)
+
+
+async def _sender_blocking(websocket) -> None:
     loop = asyncio.get_running_loop()
     while True:
         try:
@@ -365,22 +595,39 @@ async def _run_client(
         preserve_workdir=preserve_workdir,
         cleanup_delay=cleanup_delay,
     )
-    async with websockets.connect(uri) as websocket:
-        receiver = asyncio.create_task(_receiver(websocket, context))
-        sender = asyncio.create_task(_sender(websocket))
-        done, pending = await asyncio.wait(
-            {receiver, sender}, return_when=asyncio.FIRST_COMPLETED
-        )
-
-        for task in pending:
-            task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await task
-
-        for task in done:
-            exc = task.exception()
-            if exc:
-                raise exc
+    context.log_writer = _LogWriter()
+    context.base_env = dict(os.environ)
+    # permessage-deflate를 명시해 반복되는 JSON 키/로그 프리픽스를 압축하고,
+    # 대형 로그 배치를 감안해 프레임/쓰기 버퍼 한도를 넉넉히 잡는다.
+    async with websockets.connect(
+        uri,
+        compression="deflate",
+        max_size=2 ** 24,
+        write_limit=2 ** 20,
+        ping_interval=20,
+    ) as websocket:
+        context.log_queue = asyncio.Queue()
+        context.send_queue = asyncio.Queue()
+        # TaskGroup이 오류 전파/형제 취소를 맡는다. 수신·입력 태스크 중 하나가
+        # 정상 종료하면 콜백이 나머지를 취소해 그룹 전체를 닫는다.
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(_send_pump(websocket, context.send_queue)),
+                tg.create_task(_log_flusher(websocket, context)),
+            ]
+            mains = [
+                tg.create_task(_receiver(websocket, context)),
+                tg.create_task(_sender(websocket)),
+            ]
+            tasks.extend(mains)
+
+            def _cancel_rest(_: asyncio.Task) -> None:
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+
+            for task in mains:
+                task.add_done_callback(_cancel_rest)
 
 
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace: